@@ -4,34 +4,54 @@ Live Trading Bot for Kalshi Mean Reversion Strategy.
 Monitors NFL and CFB games, enters when pregame favorite drops below 50%,
 scales into position, and exits at revert bands or halftime timeout.
 """
+import atexit
+import heapq
 import logging
+import logging.handlers
+import queue
 import time
 import yaml
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 
+import numpy as np
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from kalshi_nfl_research.kalshi_client import KalshiClient
+from kalshi_nfl_research.market_ws import KalshiMarketWs
 from kalshi_nfl_research.trading_client import KalshiTradingClient
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# Setup logging: callers only enqueue records; a listener thread does the file/console I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('logs/live_trading.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drains queued records on exit
 
-# Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/live_trading.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Full format is applied by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Seconds between schedule rediscovery passes
+DISCOVERY_INTERVAL_SECS = 60
+
 
-@dataclass
+@dataclass(slots=True)
 class GameMonitor:
     """Monitors a single game for trading opportunities."""
     event_ticker: str
@@ -40,13 +60,13 @@ class GameMonitor:
     yes_subtitle: str
     kickoff_ts: int
     halftime_ts: int
-    pregame_prob: Optional[float] = None
+    pregame_prob: Optional[int] = None  # Cents
     triggered: bool = False
     positions: list = field(default_factory=list)
     highest_entry: Optional[int] = None  # Track highest price we entered at
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open position."""
     market_ticker: str
@@ -72,13 +92,26 @@ class LiveTrader:
         # Load configuration
         logger.info(f"Loading config from: {config_path}")
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=YamlSafeLoader)
+
+        # Hot-path config values, resolved once instead of on every tick/fill
+        self._dry_run = self.config['risk']['dry_run']
+        self._max_concurrent_games = self.config['risk']['max_concurrent_games']
+        self._poll_interval = self.config['monitoring']['poll_interval']
+        self._kelly_fraction = self.config['trading']['kelly_fraction']
+        self._max_exposure_pct = self.config['trading']['max_exposure_pct']
+        self._max_total_exposure = self.config['safety']['max_total_exposure']
+        self._lookahead_secs = self.config['monitoring']['lookahead_hours'] * 3600
+        self._series_tickers = [  # Enabled leagues' series, in discovery order (NFL, then CFB)
+            market['series_ticker'] for market in (self.config['markets']['nfl'], self.config['markets']['cfb'])
+            if market['enabled']
+        ]
 
         # Initialize clients
         logger.info("Initializing API clients...")
         self.public_client = KalshiClient()
 
-        if not self.config['risk']['dry_run']:
+        if not self._dry_run:
             # Real trading - need credentials
             creds = self.config['api_credentials']
             self.trading_client = KalshiTradingClient(
@@ -88,66 +121,61 @@ class LiveTrader:
                 api_secret=creds.get('api_secret'),
             )
             logger.info("✓ Trading client initialized (LIVE MODE)")
+
+            # Stream quotes for watched markets; prices fall back to REST when disconnected
+            # or when a market's quote hasn't updated for two poll intervals
+            self.market_ws = KalshiMarketWs(
+                api_key=creds.get('api_key'),
+                api_secret=creds.get('api_secret'),
+                max_quote_age_secs=2 * self._poll_interval,
+            )
         else:
             self.trading_client = None
+            self.market_ws = None
             logger.warning("⚠️  DRY RUN MODE - No real orders will be placed")
 
+        # Probability thresholds converted to integer cents once, so every price
+        # comparison is int-vs-int (round, not int(): int(0.57 * 100) == 56)
+        self._favorite_threshold_cents = round(self.config['trading']['pregame_favorite_threshold'] * 100)
+        self._trigger_threshold_cents = round(self.config['trading']['trigger_threshold'] * 100)
+
+        # Exit target = lowest revert band (None if no bands configured), resolved once
+        # so the exit paths don't walk the config on every tick/fill
+        revert_bands = self.config['trading']['revert_bands']
+        self._revert_threshold_cents = round(min(revert_bands) * 100) if revert_bands else None
+
+        # Scaling ladder as parallel arrays sorted by trigger, so the levels a price
+        # has reached are one binary search away
+        scaling_levels = sorted(self.config['trading']['scaling_levels'], key=lambda level: level['trigger'])
+        self._trigger_cents = np.array([level['trigger'] for level in scaling_levels], dtype=np.int64)
+        self._kelly_mult = np.array([level['kelly_mult'] for level in scaling_levels], dtype=np.float64)
+
         # Trading state
         self.bankroll = self.config['trading']['bankroll']
         self.active_games: dict[str, GameMonitor] = {}
+        self._dropped_tickers: set[str] = set()  # Removed from active_games; never rediscovered
+        self._halftime_heap: list[tuple[int, str]] = []  # (halftime_ts, market_ticker) of active games
         self.total_exposure = 0.0
+        self._games_with_positions = 0  # Active games whose positions list is non-empty
+        self._next_discovery = 0  # Unix seconds; 0 fires on the first tick
 
         logger.info(f"Starting bankroll: ${self.bankroll:,.2f}")
         logger.info("")
 
-    def discover_upcoming_games(self) -> list[GameMonitor]:
+    def discover_upcoming_games(self, now: int) -> list[GameMonitor]:
         """Discover games starting in the next few hours."""
         logger.info("Discovering upcoming games...")
 
-        now = int(datetime.utcnow().timestamp())
-        lookahead = now + (self.config['monitoring']['lookahead_hours'] * 3600)
+        lookahead = now + self._lookahead_secs
 
         games = []
 
-        # Check NFL
-        if self.config['markets']['nfl']['enabled']:
-            nfl_series = self.config['markets']['nfl']['series_ticker']
-            logger.info(f"  Checking {nfl_series}...")
-
-            nfl_events = self.public_client.get_events(series_ticker=nfl_series)
-
-            for event in nfl_events:
-                strike_date = event.get('strike_date')
-                if not strike_date:
-                    continue
-
-                # Only games starting soon
-                if now < strike_date < lookahead:
-                    # Get markets for this event
-                    markets = self.public_client.get_markets(event_ticker=event['event_ticker'])
-
-                    for market in markets:
-                        kickoff_ts = strike_date
-                        halftime_ts = kickoff_ts + 5400  # 90 minutes
-
-                        game = GameMonitor(
-                            event_ticker=event['event_ticker'],
-                            market_ticker=market.ticker,
-                            market_title=market.title,
-                            yes_subtitle=market.yes_sub_title or "",
-                            kickoff_ts=kickoff_ts,
-                            halftime_ts=halftime_ts,
-                        )
-                        games.append(game)
-
-        # Check CFB
-        if self.config['markets']['cfb']['enabled']:
-            cfb_series = self.config['markets']['cfb']['series_ticker']
-            logger.info(f"  Checking {cfb_series}...")
+        for series_ticker in self._series_tickers:
+            logger.info(f"  Checking {series_ticker}...")
 
-            cfb_events = self.public_client.get_events(series_ticker=cfb_series)
+            events = self.public_client.get_events(series_ticker=series_ticker)
 
-            for event in cfb_events:
+            for event in events:
                 strike_date = event.get('strike_date')
                 if not strike_date:
                     continue
@@ -174,20 +202,6 @@ class LiveTrader:
         logger.info(f"Found {len(games)} upcoming games")
         return games
 
-    def get_current_price(self, market_ticker: str) -> Optional[float]:
-        """Get current market price from orderbook."""
-        try:
-            orderbook = self.public_client.get_orderbook(market_ticker)
-            if not orderbook or not orderbook.yes_ask:
-                return None
-
-            # Use ask price (what we'd pay to buy)
-            return orderbook.yes_ask / 100.0
-
-        except Exception as e:
-            logger.error(f"Error fetching price for {market_ticker}: {e}")
-            return None
-
     def check_order_fills(self, game: GameMonitor) -> list[Position]:
         """
         Check which buy orders have been filled.
@@ -207,7 +221,7 @@ class LiveTrader:
                 continue
 
             # Check order status
-            if self.config['risk']['dry_run']:
+            if self._dry_run:
                 # In dry run, assume orders fill immediately
                 position.buy_filled = True
                 newly_filled.append(position)
@@ -217,9 +231,9 @@ class LiveTrader:
                     if status.get('status') == 'filled':
                         position.buy_filled = True
                         newly_filled.append(position)
-                        logger.info(f"✓ Buy order filled: {position.size} @ {position.entry_price}¢")
+                        logger.info("✓ Buy order filled: %s @ %s¢", position.size, position.entry_price)
                 except Exception as e:
-                    logger.error(f"Error checking order status for {position.buy_order_id}: {e}")
+                    logger.error("Error checking order status for %s: %s", position.buy_order_id, e)
 
         return newly_filled
 
@@ -228,19 +242,15 @@ class LiveTrader:
         Place limit sell orders at target exit prices.
         This implements a bracket/take-profit strategy.
         """
-        # Get the first (lowest) revert band as our exit target
-        revert_bands = self.config['trading']['revert_bands']
-        if not revert_bands:
+        # The lowest revert band (typically 0.55) is our exit target
+        exit_price_cents = self._revert_threshold_cents
+        if exit_price_cents is None:
             logger.warning("No revert bands configured, skipping exit order placement")
             return
 
-        # Use the first revert band (typically 0.55)
-        exit_price = revert_bands[0]
-        exit_price_cents = int(exit_price * 100)
-
-        logger.info(f"Placing exit order: {position.size} @ {exit_price_cents}¢")
+        logger.info("Placing exit order: %s @ %s¢", position.size, exit_price_cents)
 
-        if self.config['risk']['dry_run']:
+        if self._dry_run:
             logger.info("  [DRY RUN] Would place exit order here")
             position.sell_order_id = f"dry_run_sell_{position.buy_order_id}"
         else:
@@ -254,10 +264,10 @@ class LiveTrader:
                     order_type="limit"
                 )
                 position.sell_order_id = order.order_id
-                logger.info(f"  ✓ Exit order placed: {order.order_id}")
+                logger.info("  ✓ Exit order placed: %s", order.order_id)
 
             except Exception as e:
-                logger.error(f"  ✗ Error placing exit order: {e}")
+                logger.error("  ✗ Error placing exit order: %s", e)
 
     def calculate_position_sizes(
         self,
@@ -265,60 +275,43 @@ class LiveTrader:
         kelly_frac: float,
         max_exposure: float,
         current_price_cents: int,
-        levels_to_hit: list[dict],
+        trigger_cents: np.ndarray,
+        kelly_mult: np.ndarray,
     ) -> list[tuple[int, int]]:
         """
         Calculate position sizes with Kelly criterion and exposure limits.
 
+        trigger_cents and kelly_mult are parallel arrays, one entry per ladder level.
+
         Returns:
             List of (price_cents, size) tuples
         """
         # Calculate "ideal" Kelly sizes
-        ideal_positions = []
-        total_ideal_capital = 0
-
-        for level in levels_to_hit:
-            price_dollars = level['trigger'] / 100.0
-            base_size = int((bankroll * kelly_frac) / price_dollars)
-            actual_size = max(1, int(base_size * level['kelly_mult']))
-
-            ideal_capital = actual_size * price_dollars
-            total_ideal_capital += ideal_capital
-
-            ideal_positions.append({
-                'trigger': level['trigger'],
-                'ideal_size': actual_size,
-                'ideal_capital': ideal_capital
-            })
+        price_dollars = trigger_cents / 100.0
+        base_size = ((bankroll * kelly_frac) / price_dollars).astype(np.int64)
+        sizes = np.maximum(1, (base_size * kelly_mult).astype(np.int64))
 
-        # Check if we exceed max exposure
+        # Scale down proportionally if we exceed max exposure
+        total_ideal_capital = float((sizes * price_dollars).sum())
         max_capital_allowed = bankroll * max_exposure
 
-        if total_ideal_capital <= max_capital_allowed:
-            # Use ideal sizes
-            return [(p['trigger'], p['ideal_size']) for p in ideal_positions]
-        else:
-            # Scale down proportionally
+        if total_ideal_capital > max_capital_allowed:
             scale_factor = max_capital_allowed / total_ideal_capital
+            sizes = np.maximum(1, (sizes * scale_factor).astype(np.int64))
 
-            scaled_positions = []
-            for pos in ideal_positions:
-                scaled_size = max(1, int(pos['ideal_size'] * scale_factor))
-                scaled_positions.append((pos['trigger'], scaled_size))
-
-            return scaled_positions
-
-    def check_entry_signal(self, game: GameMonitor) -> bool:
-        """Check if we should enter a position for this game."""
-        now = int(datetime.utcnow().timestamp())
+        return list(zip(trigger_cents.tolist(), sizes.tolist()))
 
+    def check_entry_signal(self, game: GameMonitor, now: int, current_price_cents: Optional[int]) -> bool:
+        """Check if we should enter a position for this game at this tick's price."""
         # Don't trade after kickoff
         if now >= game.kickoff_ts:
             return False
 
-        # Get current price
-        current_price = self.get_current_price(game.market_ticker)
-        if current_price is None:
+        # Known non-favorite - nothing to decide, whatever the price
+        if self._is_underdog(game):
+            return False
+
+        if current_price_cents is None:
             return False
 
         # First time seeing this game - check if it's a pregame favorite
@@ -326,56 +319,45 @@ class LiveTrader:
             # Need to determine if this was a pregame favorite
             # For now, we'll track from first observation
             # In production, you'd want to check historical odds
-            game.pregame_prob = current_price
+            game.pregame_prob = current_price_cents
 
         # Check if pregame favorite
-        favorite_threshold = self.config['trading']['pregame_favorite_threshold']
-        if game.pregame_prob < favorite_threshold:
+        if game.pregame_prob < self._favorite_threshold_cents:
             return False  # Not a strong enough favorite
 
         # Check if price dropped below trigger
-        trigger_threshold = self.config['trading']['trigger_threshold']
-        if current_price < trigger_threshold:
+        if current_price_cents < self._trigger_threshold_cents:
             return True
 
         return False
 
-    def enter_position(self, game: GameMonitor):
+    def enter_position(self, game: GameMonitor, current_price_cents: int):
         """Enter position with scaling strategy."""
         logger.info("=" * 80)
-        logger.info(f"ENTRY SIGNAL: {game.market_title} ({game.yes_subtitle})")
+        logger.info("ENTRY SIGNAL: %s (%s)", game.market_title, game.yes_subtitle)
         logger.info("=" * 80)
 
-        # Get current price
-        current_price = self.get_current_price(game.market_ticker)
-        if current_price is None:
-            logger.error("Could not get current price, skipping")
-            return
-
-        current_price_cents = int(current_price * 100)
+        logger.info("Pregame: %s¢ → Current: %s¢", game.pregame_prob, current_price_cents)
 
-        logger.info(f"Pregame: {game.pregame_prob:.0%} → Current: {current_price:.0%}")
+        # Levels hit = triggers at or above the current price, placed highest first
+        first_hit = np.searchsorted(self._trigger_cents, current_price_cents, side='left')
+        trigger_cents = self._trigger_cents[first_hit:][::-1]
+        kelly_mult = self._kelly_mult[first_hit:][::-1]
 
-        # Determine which scaling levels to hit
-        scaling_levels = self.config['trading']['scaling_levels']
-        levels_to_hit = [
-            level for level in scaling_levels
-            if current_price_cents <= level['trigger']
-        ]
-
-        if not levels_to_hit:
+        if not len(trigger_cents):
             logger.info("No scaling levels triggered, skipping")
             return
 
-        logger.info(f"Scaling levels hit: {len(levels_to_hit)}")
+        logger.info("Scaling levels hit: %s", len(trigger_cents))
 
         # Calculate position sizes
         positions = self.calculate_position_sizes(
             self.bankroll,
-            self.config['trading']['kelly_fraction'],
-            self.config['trading']['max_exposure_pct'],
+            self._kelly_fraction,
+            self._max_exposure_pct,
             current_price_cents,
-            levels_to_hit
+            trigger_cents,
+            kelly_mult,
         )
 
         # Calculate total exposure
@@ -383,15 +365,15 @@ class LiveTrader:
         logger.info(f"Total capital at risk: ${total_capital:,.2f}")
 
         # Safety check
-        if total_capital > self.config['safety']['max_total_exposure']:
+        if total_capital > self._max_total_exposure:
             logger.warning(f"⚠️  Total exposure ${total_capital:,.2f} exceeds limit, skipping")
             return
 
         # Place orders
         for price_cents, size in positions:
-            logger.info(f"  Level: {size:4d} contracts @ {price_cents}¢ = ${price_cents * size / 100:.2f}")
+            logger.info("  Level: %4d contracts @ %s¢ = $%.2f", size, price_cents, price_cents * size / 100)
 
-            if self.config['risk']['dry_run']:
+            if self._dry_run:
                 logger.info("  [DRY RUN] Would place order here")
                 # Simulate position
                 position = Position(
@@ -424,12 +406,14 @@ class LiveTrader:
                     )
                     game.positions.append(position)
 
-                    logger.info(f"  ✓ Order placed: {order.order_id}")
+                    logger.info("  ✓ Order placed: %s", order.order_id)
 
                 except Exception as e:
-                    logger.error(f"  ✗ Error placing order: {e}")
+                    logger.error("  ✗ Error placing order: %s", e)
 
         # Update tracking
+        if game.positions:
+            self._games_with_positions += 1
         game.triggered = True
         game.highest_entry = max(p[0] for p in positions)
         self.total_exposure += total_capital
@@ -437,59 +421,54 @@ class LiveTrader:
         logger.info(f"Position entered. Total exposure: ${self.total_exposure:,.2f}")
         logger.info("")
 
-    def check_exit_signal(self, game: GameMonitor) -> bool:
+    def check_exit_signal(self, game: GameMonitor, now: int, current_price_cents: Optional[int]) -> bool:
         """Check if we should exit position (only at halftime or when ALL positions sold)."""
         if not game.positions:
             return False
 
-        now = int(datetime.utcnow().timestamp())
-
-        # Exit at halftime timeout (need to cancel pending sells and exit at market)
+        # Exit at halftime timeout (checked before any network I/O) (need to cancel pending sells and exit at market)
         if now >= game.halftime_ts:
-            logger.info(f"Halftime timeout reached for {game.market_title}")
+            logger.info("Halftime timeout reached for %s", game.market_title)
             return True
 
         # Update sell_filled status for all positions (but don't trigger exit yet)
         # Individual limit orders will exit automatically - we only exit at halftime
-        for position in game.positions:
-            if not position.sell_order_id:
-                continue
+        pending_sells = [p for p in game.positions if p.sell_order_id and not p.sell_filled]
+        if not pending_sells:
+            return False
 
-            if position.sell_filled:
-                continue
+        if self._dry_run:
+            # In dry run, this tick's price snapshot decides every pending sell
+            if self._revert_threshold_cents is None:
+                return False
 
-            # Check sell order status
-            if self.config['risk']['dry_run']:
-                # In dry run, check if current price hit the target
-                current_price = self.get_current_price(game.market_ticker)
-                if current_price is None:
-                    continue
+            if current_price_cents is not None and current_price_cents >= self._revert_threshold_cents:
+                for position in pending_sells:
+                    position.sell_filled = True
+                    logger.info("✓ [DRY RUN] Sell order would have filled @ %s¢", self._revert_threshold_cents)
+                # Don't return True here - let limit orders handle exits automatically
+            return False
 
-                revert_bands = self.config['trading']['revert_bands']
-                if revert_bands and current_price >= revert_bands[0]:
+        for position in pending_sells:
+            # Check sell order status
+            try:
+                status = self.trading_client.get_order_status(position.sell_order_id)
+                if status.get('status') == 'filled':
                     position.sell_filled = True
-                    logger.info(f"✓ [DRY RUN] Sell order would have filled @ {int(revert_bands[0] * 100)}¢")
+                    logger.info("✓ Sell order filled: %s contracts", position.size)
                     # Don't return True here - let limit orders handle exits automatically
-            else:
-                try:
-                    status = self.trading_client.get_order_status(position.sell_order_id)
-                    if status.get('status') == 'filled':
-                        position.sell_filled = True
-                        logger.info(f"✓ Sell order filled: {position.size} contracts")
-                        # Don't return True here - let limit orders handle exits automatically
-                except Exception as e:
-                    logger.error(f"Error checking sell order status for {position.sell_order_id}: {e}")
+            except Exception as e:
+                logger.error("Error checking sell order status for %s: %s", position.sell_order_id, e)
 
         # Only trigger exit_position() at halftime, not when individual limits fill
         return False
 
-    def exit_position(self, game: GameMonitor):
+    def exit_position(self, game: GameMonitor, now: int, current_price_cents: Optional[int]):
         """Exit all positions for this game."""
         logger.info("=" * 80)
-        logger.info(f"EXIT SIGNAL: {game.market_title}")
+        logger.info("EXIT SIGNAL: %s", game.market_title)
         logger.info("=" * 80)
 
-        now = int(datetime.utcnow().timestamp())
         is_halftime_timeout = now >= game.halftime_ts
 
         if is_halftime_timeout:
@@ -498,63 +477,62 @@ class LiveTrader:
             # Cancel any pending sell orders
             for position in game.positions:
                 if position.sell_order_id and not position.sell_filled:
-                    if not self.config['risk']['dry_run']:
+                    if not self._dry_run:
                         try:
                             self.trading_client.cancel_order(position.sell_order_id)
-                            logger.info(f"  ✓ Cancelled sell order: {position.sell_order_id}")
+                            logger.info("  ✓ Cancelled sell order: %s", position.sell_order_id)
                         except Exception as e:
-                            logger.error(f"  ✗ Error cancelling order: {e}")
+                            logger.error("  ✗ Error cancelling order: %s", e)
 
-        # Get current price for P&L calculation
-        current_price = self.get_current_price(game.market_ticker)
-        if current_price is None:
+        # Current price for P&L calculation
+        if current_price_cents is None:
             logger.error("Could not get current price for exit")
             return
 
-        current_price_cents = int(current_price * 100)
-
-        total_pnl = 0.0
-        total_contracts = 0
+        # P&L for every leg at once: filled sells exit at the limit, the rest at market
+        positions = game.positions
+        sizes = np.fromiter((p.size for p in positions), dtype=np.int64, count=len(positions))
+        entries = np.fromiter((p.entry_price for p in positions), dtype=np.int64, count=len(positions))
+        sell_filled = np.fromiter((p.sell_filled for p in positions), dtype=bool, count=len(positions))
+        limit_price_cents = self._revert_threshold_cents or current_price_cents
+        exit_cents = np.where(sell_filled, limit_price_cents, current_price_cents)
+        pnl_vec = (exit_cents - entries) * sizes / 100.0
+        total_pnl = float(pnl_vec.sum())
 
-        for position in game.positions:
-            # Calculate P&L
-            if position.sell_filled:
-                # Sell order already filled at limit price
-                revert_bands = self.config['trading']['revert_bands']
-                exit_price_cents = int(revert_bands[0] * 100) if revert_bands else current_price_cents
-                pnl_per_contract = (exit_price_cents - position.entry_price) / 100.0
-                exit_reason = f"limit @ {exit_price_cents}¢"
-            else:
-                # Exiting at current market price (halftime timeout)
-                pnl_per_contract = (current_price_cents - position.entry_price) / 100.0
-                exit_reason = f"market @ {current_price_cents}¢"
-
-            pnl_total = pnl_per_contract * position.size
+        sell_orders = []  # Market sells to submit as one batch
 
+        for position, filled, pnl_total in zip(positions, sell_filled, pnl_vec):
+            exit_reason = f"limit @ {limit_price_cents}¢" if filled else f"market @ {current_price_cents}¢"
             logger.info(
                 f"  Position: {position.size} @ {position.entry_price}¢ → {exit_reason} "
                 f"= ${pnl_total:+,.2f}"
             )
 
-            total_pnl += pnl_total
-            total_contracts += position.size
-
             # If not already filled and not dry run, place market sell order
             # IMPORTANT: Only place sell order if there's no pending sell order already!
-            if not position.sell_filled and not position.sell_order_id and not self.config['risk']['dry_run']:
-                try:
-                    order = self.trading_client.place_order(
-                        market_ticker=game.market_ticker,
-                        side="yes",
-                        action="sell",
-                        count=position.size,
-                        price=current_price_cents,
-                        order_type="limit"
-                    )
-                    logger.info(f"  ✓ Market sell order placed: {order.order_id}")
+            if not filled and not position.sell_order_id and not self._dry_run:
+                sell_orders.append({
+                    'market_ticker': game.market_ticker,
+                    'side': "yes",
+                    'action': "sell",
+                    'count': position.size,
+                    'price': current_price_cents,
+                    'order_type': "limit",
+                })
+
+        # Submit every exit leg in one request instead of one round trip per position
+        if sell_orders:
+            try:
+                results = self.trading_client.place_orders_batch(sell_orders)
+            except Exception as e:
+                logger.error("  ✗ Error placing sell orders: %s", e)
+                results = []
 
-                except Exception as e:
-                    logger.error(f"  ✗ Error placing sell order: {e}")
+            for order, error in results:
+                if order:
+                    logger.info("  ✓ Market sell order placed: %s", order.order_id)
+                else:
+                    logger.error("  ✗ Error placing sell order: %s", error)
 
         # Update bankroll
         old_bankroll = self.bankroll
@@ -566,64 +544,150 @@ class LiveTrader:
         logger.info("")
 
         # Clear positions
+        if game.positions:
+            self._games_with_positions -= 1
         game.positions.clear()
 
+    def _is_underdog(self, game: GameMonitor) -> bool:
+        """True once the game's pregame price shows it isn't a strong enough favorite to trade."""
+        return game.pregame_prob is not None and game.pregame_prob < self._favorite_threshold_cents
+
+    def _needs_price(self, game: GameMonitor, now: int) -> bool:
+        """True if this tick's entry or exit logic will read the game's price."""
+        if not game.triggered and now < game.kickoff_ts:
+            return not self._is_underdog(game)  # Entry check
+        if game.positions:
+            return self._dry_run or now >= game.halftime_ts  # Simulated sell fills / halftime exit
+        return False
+
+    def fetch_prices(self, market_tickers: list[str]) -> dict[str, int]:
+        """
+        Current yes ask in cents for several markets: WebSocket snapshots where
+        available, one batched REST request for the rest.
+
+        Markets without an ask (or whose fetch failed) are omitted.
+        """
+        prices = {}
+        missing = []
+        for market_ticker in market_tickers:
+            quote = self.market_ws.get_quote(market_ticker) if self.market_ws else None
+            if quote is None:
+                missing.append(market_ticker)
+            elif quote[0]:
+                prices[market_ticker] = quote[0]
+
+        if missing:
+            try:
+                for market in self.public_client.get_markets_by_ticker(missing):
+                    if market.yes_ask:
+                        prices[market.ticker] = market.yes_ask
+            except Exception as e:
+                logger.error("Error fetching prices for %s markets: %s", len(missing), e)
+
+        return prices
+
+    def _tick_game(self, game: GameMonitor, now: int, current_price_cents: Optional[int]) -> bool:
+        """
+        Run one tick for a single game against this tick's price snapshot.
+
+        Returns:
+            True if the game is finished and can be removed from active_games
+        """
+        # Games past halftime are evicted by run() off the halftime heap before this is called
+
+        # Non-favorites never trigger - stop monitoring them
+        if not game.triggered and self._is_underdog(game):
+            logger.info("Not a pregame favorite (%s¢), no longer monitoring %s", game.pregame_prob, game.market_title)
+            return True
+
+        # Check for entry signal
+        if not game.triggered and self.check_entry_signal(game, now, current_price_cents):
+            # Check concurrent game limit
+            active_positions = self._games_with_positions
+            max_concurrent = self._max_concurrent_games
+
+            if active_positions < max_concurrent:
+                self.enter_position(game, current_price_cents)
+            else:
+                logger.warning("Max concurrent games (%s) reached, skipping entry", max_concurrent)
+
+        # Check for buy order fills and place exit orders
+        if game.positions:
+            newly_filled = self.check_order_fills(game)
+            for position in newly_filled:
+                # Place exit order for this filled position
+                self.place_exit_orders(position)
+
+        # Check for exit signal
+        if game.positions and self.check_exit_signal(game, now, current_price_cents):
+            self.exit_position(game, now, current_price_cents)
+            return True
+
+        return False
+
+    def _remove_game(self, market_ticker: str):
+        """Stop monitoring a game for good."""
+        self._dropped_tickers.add(market_ticker)
+        if self.active_games.pop(market_ticker).positions:
+            self._games_with_positions -= 1
+        if self.market_ws:
+            self.market_ws.forget(market_ticker)
+
     def run(self):
         """Main trading loop."""
         logger.info("Starting trading bot...")
         logger.info("")
 
         try:
+            next_tick = time.monotonic()
             while True:
-                now = int(datetime.utcnow().timestamp())
+                now = int(time.time())  # Single timestamp shared by the whole tick
 
-                # Discover new games periodically
-                if len(self.active_games) == 0:
-                    upcoming_games = self.discover_upcoming_games()
+                # Discover new games periodically (deadline-based, so any poll interval works)
+                if now >= self._next_discovery:
+                    self._next_discovery = now + DISCOVERY_INTERVAL_SECS
+                    upcoming_games = self.discover_upcoming_games(now)
 
                     for game in upcoming_games:
-                        if game.market_ticker not in self.active_games:
+                        if game.market_ticker not in self.active_games and game.market_ticker not in self._dropped_tickers:
                             self.active_games[game.market_ticker] = game
-                            logger.info(f"Monitoring: {game.market_title} @ {datetime.fromtimestamp(game.kickoff_ts).strftime('%Y-%m-%d %H:%M UTC')}")
+                            heapq.heappush(self._halftime_heap, (game.halftime_ts, game.market_ticker))
+                            if self.market_ws:
+                                self.market_ws.subscribe(game.market_ticker)
+                            logger.info(f"Monitoring: {game.market_title} @ {time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(game.kickoff_ts))}")
+
+                # Games past halftime come off a heap keyed by halftime_ts, so the
+                # per-game work never has to test every game against the clock
+                while self._halftime_heap and self._halftime_heap[0][0] < now:
+                    _, market_ticker = heapq.heappop(self._halftime_heap)
+                    if market_ticker in self.active_games:
+                        self._remove_game(market_ticker)
 
                 # Monitor active games
                 games_to_remove = []
 
-                for market_ticker, game in list(self.active_games.items()):
-                    # Remove games past halftime
-                    if now > game.halftime_ts:
-                        games_to_remove.append(market_ticker)
-                        continue
-
-                    # Check for entry signal
-                    if not game.triggered and self.check_entry_signal(game):
-                        # Check concurrent game limit
-                        active_positions = sum(1 for g in self.active_games.values() if g.positions)
-                        max_concurrent = self.config['risk']['max_concurrent_games']
-
-                        if active_positions < max_concurrent:
-                            self.enter_position(game)
-                        else:
-                            logger.warning(f"Max concurrent games ({max_concurrent}) reached, skipping entry")
-
-                    # Check for buy order fills and place exit orders
-                    if game.positions:
-                        newly_filled = self.check_order_fills(game)
-                        for position in newly_filled:
-                            # Place exit order for this filled position
-                            self.place_exit_orders(position)
-
-                    # Check for exit signal
-                    if game.positions and self.check_exit_signal(game):
-                        self.exit_position(game)
+                # One batched price fetch for every game whose entry/exit logic reads a price
+                prices = self.fetch_prices([
+                    market_ticker for market_ticker, game in self.active_games.items()
+                    if self._needs_price(game, now)
+                ])
+
+                for market_ticker, game in self.active_games.items():
+                    if self._tick_game(game, now, prices.get(market_ticker)):
                         games_to_remove.append(market_ticker)
 
                 # Clean up finished games
                 for market_ticker in games_to_remove:
-                    del self.active_games[market_ticker]
+                    self._remove_game(market_ticker)
 
-                # Sleep before next poll
-                time.sleep(self.config['monitoring']['poll_interval'])
+                # Fixed-rate schedule: the tick's own work comes out of the wait, and if
+                # we've fallen more than a whole interval behind, restart the cadence
+                next_tick += self._poll_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                elif sleep_for < -self._poll_interval:
+                    next_tick = time.monotonic()
 
         except KeyboardInterrupt:
             logger.info("")
@@ -633,6 +697,8 @@ class LiveTrader:
             logger.info(f"Final bankroll: ${self.bankroll:,.2f}")
 
         finally:
+            if self.market_ws:
+                self.market_ws.close()
             if self.trading_client:
                 self.trading_client.close()
             self.public_client.close()
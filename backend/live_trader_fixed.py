@@ -4,88 +4,205 @@ Uses external schedule CSVs since Kalshi doesn't provide strike_date for footbal
 
 Deployment: Oct 25, 2025 - Critical halftime fix + all 42 CFB games
 """
+import atexit
+import bisect
+import collections
+import heapq
+import itertools
+import json
 import logging
+import logging.handlers
 import os
+import pickle
+import queue
+import sqlite3
+import threading
 import time
 import yaml
-import csv
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from dotenv import load_dotenv
 
+import numpy as np
+import pandas as pd
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from kalshi_nfl_research.circuit_breaker import CircuitBreaker
 from kalshi_nfl_research.kalshi_client import KalshiClient
+from kalshi_nfl_research.market_ws import KalshiMarketWs
+from kalshi_nfl_research.state_db import GAME_STATE_COLUMNS, GameStateDB
 from kalshi_nfl_research.trading_client import KalshiTradingClient
 from supabase_logger import SupabaseLogger
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Load environment variables
 load_dotenv()
 
 # Create logs directory before logging config
 Path("logs").mkdir(exist_ok=True)
 
-# Setup logging
+# Setup logging: callers only enqueue records; a listener thread does the file/console I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('logs/live_trading.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drains queued records on exit
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/live_trading.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Full format is applied by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Schedule CSV columns we actually use (everything else is skipped by the parser)
+SCHEDULE_TEXT_COLUMNS = ['event_ticker', 'market_ticker', 'market_title', 'yes_subtitle']
+SCHEDULE_TEXT_DTYPES = {col: str for col in SCHEDULE_TEXT_COLUMNS}
+
+# (league, path, kickoff column) for each enriched schedule CSV
+NFL_SCHEDULE = ('NFL', 'artifacts/nfl_markets_2025_enriched.csv', 'strike_date')
+CFB_SCHEDULE = ('CFB', 'artifacts/cfb_markets_2025_enriched.csv', 'kickoff_ts')
+
+# Bump when the parsed schedule shape changes so stale caches are ignored
+SCHEDULE_CACHE_VERSION = 3
+
+# Environment variables that override config values: (variable, section, key, type)
+# Note: max_total_exposure removed - now calculated dynamically from bankroll × max_exposure_pct
+ENV_OVERRIDES = (
+    ('TRADING_BANKROLL', 'trading', 'bankroll', float),
+    ('TRADING_MAX_EXPOSURE_PCT', 'trading', 'max_exposure_pct', float),
+    ('TRADING_KELLY_FRACTION', 'trading', 'kelly_fraction', float),
+    ('TRADING_REVERT_FRACTION', 'trading', 'revert_fraction', float),
+    ('TRADING_TRIGGER_THRESHOLD', 'trading', 'trigger_threshold', float),
+    ('RISK_MAX_CONCURRENT_GAMES', 'risk', 'max_concurrent_games', int),
+    ('SAFETY_MAX_CONTRACTS_PER_ORDER', 'safety', 'max_contracts_per_order', int),
+    ('MONITORING_POLL_INTERVAL', 'monitoring', 'poll_interval', int),
+    ('VOLUME_THRESHOLD_USD', 'trading', 'volume_threshold_usd', float),
+)
+
+# Bump when the cached config shape changes so stale caches are ignored
+CONFIG_CACHE_VERSION = 1
 
-def load_config_with_env_overrides(config_path: str) -> dict:
-    """Load config from YAML and override with environment variables."""
-    # Load base config
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+# Halftime timeout, measured from kickoff
+HALFTIME_OFFSET_SECS = 5400  # 90 minutes
+
+# Games are dropped this long after kickoff (a full game plus overtime margin)
+GAME_END_OFFSET_SECS = 4 * 3600
+
+# Main loop cadences (seconds)
+DISCOVERY_INTERVAL_SECS = 60
+STATUS_LOG_INTERVAL_SECS = 60
 
-    # Override trading parameters
-    if os.getenv('TRADING_BANKROLL'):
-        config['trading']['bankroll'] = float(os.getenv('TRADING_BANKROLL'))
+# Games processed concurrently per tick (each mostly waits on exchange I/O)
+MAX_GAME_WORKERS = 8
 
-    if os.getenv('TRADING_MAX_EXPOSURE_PCT'):
-        config['trading']['max_exposure_pct'] = float(os.getenv('TRADING_MAX_EXPOSURE_PCT'))
+# Keep-alive ping cadence for idle exchange connections (seconds)
+KEEPALIVE_INTERVAL_SECS = 30
 
-    if os.getenv('TRADING_KELLY_FRACTION'):
-        config['trading']['kelly_fraction'] = float(os.getenv('TRADING_KELLY_FRACTION'))
+# Dashboard write queue: past this depth, droppable telemetry is skipped
+DB_QUEUE_SOFT_LIMIT = 1000
+DB_DROPPABLE_METHODS = {'log_price_tick'}
 
-    if os.getenv('TRADING_REVERT_FRACTION'):
-        config['trading']['revert_fraction'] = float(os.getenv('TRADING_REVERT_FRACTION'))
+# The writer collects up to this many queued writes (or waits this long) per flush
+DB_BATCH_MAX_ITEMS = 64
+DB_BATCH_WINDOW_SECS = 0.25
 
-    if os.getenv('TRADING_TRIGGER_THRESHOLD'):
-        config['trading']['trigger_threshold'] = float(os.getenv('TRADING_TRIGGER_THRESHOLD'))
+# Recently written order statuses remembered to skip duplicate dashboard writes
+ORDER_STATUS_CACHE_SIZE = 1024
 
-    # Override risk parameters
-    if os.getenv('RISK_MAX_CONCURRENT_GAMES'):
-        config['risk']['max_concurrent_games'] = int(os.getenv('RISK_MAX_CONCURRENT_GAMES'))
+# Local per-game state so a restart resumes with captured checkpoints and open orders instead of losing them
+STATE_DB_PATH = 'state.db'
 
-    # Note: max_total_exposure removed - now calculated dynamically from bankroll × max_exposure_pct
 
-    # Override safety parameters
-    if os.getenv('SAFETY_MAX_CONTRACTS_PER_ORDER'):
-        config['safety']['max_contracts_per_order'] = int(os.getenv('SAFETY_MAX_CONTRACTS_PER_ORDER'))
+def cents_to_prob(cents: Optional[int]) -> Optional[float]:
+    """Convert an integer-cents price to the 0-1 probability the dashboard stores."""
+    return cents / 100 if cents is not None else None
 
-    # Override monitoring parameters
-    if os.getenv('MONITORING_POLL_INTERVAL'):
-        config['monitoring']['poll_interval'] = int(os.getenv('MONITORING_POLL_INTERVAL'))
 
-    # Add volume threshold (new feature)
-    if os.getenv('VOLUME_THRESHOLD_USD'):
-        config['trading']['volume_threshold_usd'] = float(os.getenv('VOLUME_THRESHOLD_USD'))
-    else:
-        config['trading']['volume_threshold_usd'] = config['trading'].get('volume_threshold_usd', 50000)
+def _load_yaml_config(config_path: str) -> dict:
+    """
+    Parse the YAML config file.
+
+    The parsed config is saved as JSON next to the YAML and reused on later
+    starts while the YAML's mtime and size are unchanged.
+    """
+    cache_path = Path(config_path).with_suffix('.config.json')
+    stat = os.stat(config_path)
+    cache_key = [CONFIG_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('key') == cache_key:
+            return cached['config']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+    with open(config_path, 'rb') as f:  # libyaml decodes the bytes itself
+        config = yaml.load(f, Loader=YamlSafeLoader)
+
+    # Best effort: a failed write only costs a re-parse next start
+    tmp_path = cache_path.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': cache_key, 'config': config}, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
 
     return config
 
 
-@dataclass
+def load_config_with_env_overrides(config_path: str) -> tuple[dict, list[str]]:
+    """
+    Load config from YAML and override with environment variables.
+
+    Returns:
+        (config, names of the environment variables that overrode a value)
+    """
+    # Load base config
+    config = _load_yaml_config(config_path)
+
+    env = os.environ
+    env_overrides = []
+    for env_var, section, key, cast in ENV_OVERRIDES:
+        value = env.get(env_var)
+        if value:
+            config[section][key] = cast(value)
+            env_overrides.append(env_var)
+
+    # Volume threshold (new feature) may be missing from older configs
+    config['trading'].setdefault('volume_threshold_usd', 50000)
+
+    return config, env_overrides
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduleEntry:
+    """One market from a schedule CSV, with kickoff and halftime times."""
+    event_ticker: str
+    market_ticker: str
+    market_title: str
+    yes_subtitle: str
+    kickoff_ts: int
+    halftime_ts: int
+
+
+@dataclass(slots=True)
 class GameMonitor:
     """Monitors a single game for trading opportunities."""
     event_ticker: str
@@ -96,12 +213,12 @@ class GameMonitor:
     halftime_ts: int
 
     # Legacy field (kept for compatibility, will be set at 6h checkpoint)
-    pregame_prob: Optional[float] = None
+    pregame_prob: Optional[int] = None  # Cents
 
-    # Three checkpoint odds
-    odds_6h: Optional[float] = None
-    odds_3h: Optional[float] = None
-    odds_30m: Optional[float] = None
+    # Three checkpoint odds (favorite's ask in cents)
+    odds_6h: Optional[int] = None
+    odds_3h: Optional[int] = None
+    odds_30m: Optional[int] = None
 
     # Checkpoint timestamps (when we captured each)
     checkpoint_6h_ts: Optional[int] = None
@@ -118,13 +235,15 @@ class GameMonitor:
     triggered: bool = False  # Have we placed orders yet?
     order_ids: list = field(default_factory=list)  # Pending buy order IDs
     positions: list = field(default_factory=list)  # Filled positions only
+    highest_entry: Optional[int] = None  # Highest ladder price we placed orders at
+    exit_price_cents: dict = field(default_factory=dict)  # Ladder entry price -> measured-move exit price
 
     # Exit tracking
     exiting: bool = False  # Are we in exit process?
     exit_order_ids: list = field(default_factory=list)  # Sell order IDs during exit
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open position."""
     market_ticker: str
@@ -139,6 +258,13 @@ class Position:
 class LiveTrader:
     """Main live trading bot - FIXED to use external schedules."""
 
+    # Pregame checkpoints in capture order: (odds attr, timestamp attr, label, seconds before kickoff)
+    CHECKPOINTS = (
+        ('odds_6h', 'checkpoint_6h_ts', '6h', 6 * 3600),
+        ('odds_3h', 'checkpoint_3h_ts', '3h', 3 * 3600),
+        ('odds_30m', 'checkpoint_30m_ts', '30m', 30 * 60),
+    )
+
     def __init__(self, config_path: str = "live_trading_config.yaml"):
         logger.info("=" * 80)
         logger.info("KALSHI LIVE TRADING BOT (FIXED VERSION)")
@@ -146,7 +272,25 @@ class LiveTrader:
         logger.info("")
 
         # Load configuration (with environment variable overrides)
-        self.config = load_config_with_env_overrides(config_path)
+        self.config, env_overrides = load_config_with_env_overrides(config_path)
+
+        # Hot-path config values, resolved once instead of on every tick/fill
+        self._dry_run = self.config['risk']['dry_run']
+        self._kelly_fraction = self.config['trading']['kelly_fraction']
+        self._max_exposure_pct = self.config['trading']['max_exposure_pct']
+        self._revert_fraction = self.config['trading'].get('revert_fraction', 0.50)
+        self._volume_threshold_usd = self.config['trading'].get('volume_threshold_usd', 50000)
+        self._max_concurrent_games = self.config['risk']['max_concurrent_games']
+        self._lookahead_secs = self.config['monitoring']['lookahead_hours'] * 3600
+        self._poll_interval = self.config['monitoring']['poll_interval']
+        # Quotes live for half a tick: long enough to outlast the tick's own reads
+        # (including the batched prefetch), short enough that every tick starts fresh
+        self._quote_ttl = self._poll_interval / 2
+
+        # Scaling ladder as parallel arrays for position sizing
+        scaling_levels = self.config['trading']['scaling_levels']
+        self._trigger_cents = np.array([level['trigger'] for level in scaling_levels], dtype=np.int64)
+        self._kelly_mult = np.array([level['kelly_mult'] for level in scaling_levels], dtype=np.float64)
 
         # Log configuration (show overrides)
         logger.info("Configuration loaded:")
@@ -157,28 +301,6 @@ class LiveTrader:
         logger.info(f"  Volume Threshold: ${self.config['trading']['volume_threshold_usd']:,.0f}")
 
         # Show if any environment variables are overriding config
-        env_overrides = []
-        if os.getenv('TRADING_BANKROLL'):
-            env_overrides.append('TRADING_BANKROLL')
-        if os.getenv('TRADING_MAX_EXPOSURE_PCT'):
-            env_overrides.append('TRADING_MAX_EXPOSURE_PCT')
-        if os.getenv('TRADING_KELLY_FRACTION'):
-            env_overrides.append('TRADING_KELLY_FRACTION')
-        if os.getenv('TRADING_REVERT_FRACTION'):
-            env_overrides.append('TRADING_REVERT_FRACTION')
-        if os.getenv('TRADING_TRIGGER_THRESHOLD'):
-            env_overrides.append('TRADING_TRIGGER_THRESHOLD')
-        if os.getenv('RISK_MAX_CONCURRENT_GAMES'):
-            env_overrides.append('RISK_MAX_CONCURRENT_GAMES')
-        if os.getenv('RISK_MAX_TOTAL_EXPOSURE'):
-            env_overrides.append('RISK_MAX_TOTAL_EXPOSURE')
-        if os.getenv('SAFETY_MAX_CONTRACTS_PER_ORDER'):
-            env_overrides.append('SAFETY_MAX_CONTRACTS_PER_ORDER')
-        if os.getenv('MONITORING_POLL_INTERVAL'):
-            env_overrides.append('MONITORING_POLL_INTERVAL')
-        if os.getenv('VOLUME_THRESHOLD_USD'):
-            env_overrides.append('VOLUME_THRESHOLD_USD')
-
         if env_overrides:
             logger.info(f"  Using environment variable overrides: {', '.join(env_overrides)}")
         logger.info("")
@@ -187,7 +309,7 @@ class LiveTrader:
         # Rate limit: 75ms = ~13.3 req/sec (safely under Basic tier 20 req/sec limit)
         self.public_client = KalshiClient(rate_limit_sleep_ms=75)
 
-        if not self.config['risk']['dry_run']:
+        if not self._dry_run:
             creds = self.config['api_credentials']
             # Read from environment variables first, fallback to config
             email = os.getenv('KALSHI_EMAIL') or creds.get('email')
@@ -203,22 +325,64 @@ class LiveTrader:
             )
             logger.info("✓ Trading client initialized (LIVE MODE)")
             logger.info(f"  Using credentials from: {'environment variables' if os.getenv('KALSHI_API_KEY') else 'config file'}")
+
+            # Stream quotes for watched markets instead of polling get_market every tick
+            # (the WS feed needs API-key auth, so dry runs keep polling over REST); quotes that
+            # haven't updated for two poll intervals are treated as missing and re-read over REST
+            self.market_ws = KalshiMarketWs(
+                api_key=api_key, api_secret=api_secret, max_quote_age_secs=2 * self._poll_interval
+            )
         else:
             self.trading_client = None
+            self.market_ws = None
             logger.warning("⚠️  DRY RUN MODE - No real orders will be placed")
 
         # Load schedules
-        self.nfl_schedule = self._load_nfl_schedule()
-        self.cfb_schedule = self._load_cfb_schedule()
+        self.nfl_schedule = self._load_schedule(*NFL_SCHEDULE)
+        self.cfb_schedule = self._load_schedule(*CFB_SCHEDULE)
 
         logger.info(f"Loaded {len(self.nfl_schedule)} NFL games with kickoff times")
         logger.info(f"Loaded {len(self.cfb_schedule)} CFB games with kickoff times")
         logger.info("")
 
+        # Combined schedule sorted by kickoff so discovery only scans the lookahead window
+        self._games_by_kickoff = sorted(
+            itertools.chain(self.nfl_schedule.values(), self.cfb_schedule.values()),
+            key=lambda g: g.kickoff_ts,
+        )
+        self._kickoffs = [g.kickoff_ts for g in self._games_by_kickoff]  # Parallel list for bisect
+
+        # Fail fast instead of hammering the exchange while it is flapping
+        self._exchange_cb = CircuitBreaker(name="exchange", fail_threshold=5, open_secs=30)
+
+        # market_ticker -> ((yes_ask, no_ask), monotonic expiry) for REST fallbacks
+        self._market_cache: dict[str, tuple] = {}
+
+        # Keep exchange connections warm so order placement doesn't pay a fresh handshake
+        self._stop_event = threading.Event()
+        self._keepalive_thread = threading.Thread(target=self._keepalive_worker, name="keepalive", daemon=True)
+        self._keepalive_thread.start()
+
+        # Per-game tick work runs on a small pool; _state_lock guards bankroll/exposure and
+        # the open-position count (re-entrant: entries already hold it when they record fills)
+        self._game_executor = ThreadPoolExecutor(max_workers=MAX_GAME_WORKERS, thread_name_prefix="game")
+        self._state_lock = threading.RLock()
+
         # Trading state
         self.bankroll = self.config['trading']['bankroll']
         self.active_games: dict[str, GameMonitor] = {}
+        self._dropped_tickers: set[str] = set()  # Removed from active_games; never rediscovered
+        self._halftime_heap: list[tuple[int, str]] = []  # (halftime_ts, market_ticker) of active games
         self.total_exposure = 0.0
+        self._games_with_positions = 0  # Active games whose positions list is non-empty
+
+        # Main loop deadlines (unix seconds); 0 fires on the first tick
+        self._next_discovery = 0
+        self._next_status_log = 0
+
+        # Resume games still in play from the local state DB (written from game worker threads)
+        self._state_db = GameStateDB(STATE_DB_PATH, dry_run=self._dry_run)
+        self._restore_game_state(int(time.time()))
 
         logger.info(f"Starting bankroll: ${self.bankroll:,.2f}")
         logger.info("")
@@ -227,14 +391,23 @@ class LiveTrader:
         self.supabase = SupabaseLogger()
         self._check_database_health()
 
+        # Dashboard writes go through a background worker so they never block trading
+        self._db_queue: queue.Queue = queue.Queue()
+        self._db_thread = threading.Thread(target=self._db_worker, name="supabase-writer", daemon=True)
+        self._db_thread.start()
+
+        # order_id -> (status, filled_size) last sent to the dashboard, LRU-bounded
+        self._order_status_cache: collections.OrderedDict = collections.OrderedDict()
+        self._order_status_lock = threading.Lock()
+
         # Log initial bankroll
-        if self.supabase.client:
-            self.supabase.log_bankroll_change(
-                timestamp=int(time.time()),
-                new_amount=self.bankroll,
-                change=0.0,
-                description="Bot started"
-            )
+        self._db_submit(
+            'log_bankroll_change',
+            timestamp=int(time.time()),
+            new_amount=self.bankroll,
+            change=0.0,
+            description="Bot started"
+        )
 
     def _check_database_health(self):
         """Verify database connection and schema before trading."""
@@ -252,114 +425,325 @@ class LiveTrader:
             logger.error(f"✗ Database health check failed: {e}")
             raise Exception("Database not accessible")
 
-    def _load_nfl_schedule(self) -> dict:
-        """Load NFL enriched schedule with kickoff times."""
+    def _keepalive_worker(self):
+        """Ping the exchange periodically until shutdown."""
+        while not self._stop_event.wait(KEEPALIVE_INTERVAL_SECS):
+            self.public_client.ping()
+            if self.trading_client:
+                self.trading_client.ping()
+
+    def _db_submit(self, method_name: str, *args, **kwargs):
+        """Queue a SupabaseLogger call for the background writer."""
+        if not self.supabase.client:
+            return
+
+        if method_name in DB_DROPPABLE_METHODS and self._db_queue.qsize() > DB_QUEUE_SOFT_LIMIT:
+            logger.debug(f"Dashboard queue backlogged, dropping {method_name}")
+            return
+
+        self._db_queue.put((method_name, args, kwargs))
+
+    def _db_worker(self):
+        """Drain the dashboard queue in FIFO batches until a None sentinel arrives."""
+        stopping = False
+        while not stopping:
+            batch = [self._db_queue.get()]
+            deadline = time.monotonic() + DB_BATCH_WINDOW_SECS
+            while batch[-1] is not None and len(batch) < DB_BATCH_MAX_ITEMS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._db_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            stopping = batch[-1] is None
+            try:
+                self._db_write_batch(batch[:-1] if stopping else batch)
+            finally:
+                for _ in batch:
+                    self._db_queue.task_done()
+
+    def _db_write_batch(self, items: list):
+        """Apply queued writes in order, sending each run of price ticks as one insert."""
+        for is_tick, group in itertools.groupby(items, key=lambda item: item[0] == 'log_price_tick'):
+            if is_tick:
+                calls = [('log_price_ticks', ([kwargs for _, _, kwargs in group],), {})]
+            else:
+                calls = group
+
+            for method_name, args, kwargs in calls:
+                try:
+                    getattr(self.supabase, method_name)(*args, **kwargs)
+                except Exception as db_error:
+                    logger.error(f"✗ Dashboard write {method_name} failed: {db_error}")
+
+    def _submit_order_status(self, order_ids: list, status: str, filled_size: int = 0):
+        """Queue an order status update, skipping orders already written with the same values."""
+        changed = []
+        with self._order_status_lock:
+            for order_id in order_ids:
+                if self._order_status_cache.get(order_id) == (status, filled_size):
+                    continue
+                self._order_status_cache[order_id] = (status, filled_size)
+                self._order_status_cache.move_to_end(order_id)
+                changed.append(order_id)
+            while len(self._order_status_cache) > ORDER_STATUS_CACHE_SIZE:
+                self._order_status_cache.popitem(last=False)
+
+        if len(changed) == 1:
+            self._db_submit('update_order_status', changed[0], status, filled_size)
+        elif changed:
+            self._db_submit('update_orders_status', changed, status, filled_size)
+
+    def _db_flush(self, timeout: float = 10.0):
+        """Stop the dashboard writer after it drains any queued writes."""
+        self._db_queue.put(None)
+        self._db_thread.join(timeout)
+
+    def _save_game_state(self, game: GameMonitor):
+        """Upsert a game's checkpoints, eligibility and open orders; failures are logged, never raised."""
+        state = {col: getattr(game, col) for col in GAME_STATE_COLUMNS}
+        state['positions'] = [asdict(position) for position in game.positions]
+        try:
+            self._state_db.save(state)
+        except sqlite3.Error as e:
+            logger.error(f"✗ Could not save state for {game.market_ticker}: {e}")
+
+    def _restore_game_state(self, now: int):
+        """Rehydrate active_games, with their pending orders and positions, for games before halftime."""
+        states = self._state_db.load(now)
+
+        for state in states:
+            positions = [Position(**position) for position in state.pop('positions')]
+            game = GameMonitor(**state)
+            for position in positions:
+                self._add_position(game, position)
+
+            self.active_games[game.market_ticker] = game
+            heapq.heappush(self._halftime_heap, (game.halftime_ts, game.market_ticker))
+            if self.market_ws:
+                self.market_ws.subscribe(game.market_ticker)
+
+        if states:
+            logger.info(f"Restored {len(states)} game(s) from {STATE_DB_PATH}")
+            logger.info("")
+
+    def _load_schedule(self, league: str, path: str, kickoff_col: str) -> dict[str, ScheduleEntry]:
+        """
+        Load an enriched schedule CSV as ScheduleEntry records keyed by market_ticker.
+
+        The parsed schedule is pickled next to the CSV and reused on later starts
+        while the CSV's mtime and size are unchanged.
+        """
         schedule = {}
-        path = 'artifacts/nfl_markets_2025_enriched.csv'
-        
+        cache_path = Path(path).with_suffix('.schedule.pkl')
+
         try:
-            with open(path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Key by market_ticker for easy lookup
-                    schedule[row['market_ticker']] = {
-                        'event_ticker': row['event_ticker'],
-                        'market_ticker': row['market_ticker'],
-                        'market_title': row['market_title'],
-                        'yes_subtitle': row['yes_subtitle'],
-                        'kickoff_ts': int(row['strike_date']),
-                    }
-            logger.info(f"✓ Loaded NFL schedule from {path}")
+            stat = os.stat(path)
+            cache_key = (SCHEDULE_CACHE_VERSION, kickoff_col, stat.st_mtime_ns, stat.st_size)
+
+            cached = self._read_schedule_cache(cache_path, cache_key)
+            if cached is not None:
+                logger.info(f"✓ Loaded {league} schedule from cache {cache_path}")
+                return cached
+
+            df = pd.read_csv(
+                path,
+                usecols=SCHEDULE_TEXT_COLUMNS + [kickoff_col],
+                dtype={**SCHEDULE_TEXT_DTYPES, kickoff_col: 'int64'},
+                keep_default_na=False,
+                engine='c',
+            )
+            df = df.rename(columns={kickoff_col: 'kickoff_ts'})
+            df['halftime_ts'] = df['kickoff_ts'] + HALFTIME_OFFSET_SECS
+            # Key by market_ticker for easy lookup (last row wins on duplicates)
+            df = df.drop_duplicates('market_ticker', keep='last')
+            schedule = {
+                row.market_ticker: ScheduleEntry(
+                    row.event_ticker, row.market_ticker, row.market_title, row.yes_subtitle,
+                    int(row.kickoff_ts), int(row.halftime_ts),
+                )
+                for row in df.itertuples(index=False)
+            }
+            logger.info(f"✓ Loaded {league} schedule from {path}")
+
+            self._write_schedule_cache(cache_path, cache_key, schedule)
         except Exception as e:
-            logger.warning(f"Could not load NFL schedule: {e}")
-        
+            logger.warning(f"Could not load {league} schedule: {e}")
+
         return schedule
 
-    def _load_cfb_schedule(self) -> dict:
-        """Load CFB enriched schedule with kickoff times."""
-        schedule = {}
-        path = 'artifacts/cfb_markets_2025_enriched.csv'
-        
+    def _read_schedule_cache(self, cache_path: Path, cache_key: tuple) -> Optional[dict[str, ScheduleEntry]]:
+        """Return the cached schedule if it was built from the same CSV, else None."""
         try:
-            with open(path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    schedule[row['market_ticker']] = {
-                        'event_ticker': row['event_ticker'],
-                        'market_ticker': row['market_ticker'],
-                        'market_title': row['market_title'],
-                        'yes_subtitle': row['yes_subtitle'],
-                        'kickoff_ts': int(row['kickoff_ts']),
-                    }
-            logger.info(f"✓ Loaded CFB schedule from {path}")
+            with open(cache_path, 'rb') as f:
+                stored_key, schedule = pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.warning(f"Could not load CFB schedule: {e}")
-        
-        return schedule
+            logger.debug(f"Ignoring unreadable schedule cache {cache_path}: {e}")
+            return None
+
+        return schedule if stored_key == cache_key else None
+
+    def _write_schedule_cache(self, cache_path: Path, cache_key: tuple, schedule: dict):
+        """Best-effort write of the parsed schedule; failures only cost a re-parse."""
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, schedule), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write schedule cache {cache_path}: {e}")
+
+    def discover_upcoming_games(self, now: int) -> list[GameMonitor]:
+        """
+        Discover games starting in the next few hours using schedules.
 
-    def discover_upcoming_games(self) -> list[GameMonitor]:
-        """Discover games starting in the next few hours using schedules."""
-        now = int(datetime.utcnow().timestamp())
-        lookahead = now + (self.config['monitoring']['lookahead_hours'] * 3600)
+        Games already in active_games are skipped so their monitors are reused
+        rather than re-allocated on every rediscovery pass, and games already
+        dropped (e.g. vetoed at 30m) are not brought back.
+        """
+        lookahead = now + self._lookahead_secs
 
         games = []
 
-        # Check schedules for upcoming games
-        for market_ticker, game_data in {**self.nfl_schedule, **self.cfb_schedule}.items():
-            kickoff_ts = game_data['kickoff_ts']
-            
-            # Only games starting soon
-            if now < kickoff_ts < lookahead:
-                halftime_ts = kickoff_ts + 5400  # 90 minutes
-
-                game = GameMonitor(
-                    event_ticker=game_data['event_ticker'],
-                    market_ticker=market_ticker,
-                    market_title=game_data['market_title'],
-                    yes_subtitle=game_data['yes_subtitle'],
-                    kickoff_ts=kickoff_ts,
-                    halftime_ts=halftime_ts,
-                )
-                games.append(game)
+        # Binary-search the window now < kickoff_ts < lookahead in the sorted schedule
+        start = bisect.bisect_right(self._kickoffs, now)
+        end = bisect.bisect_left(self._kickoffs, lookahead, lo=start)
+
+        for game_data in self._games_by_kickoff[start:end]:
+            market_ticker = game_data.market_ticker
+            if market_ticker in self.active_games or market_ticker in self._dropped_tickers:
+                continue
+
+            game = GameMonitor(
+                event_ticker=game_data.event_ticker,
+                market_ticker=market_ticker,
+                market_title=game_data.market_title,
+                yes_subtitle=game_data.yes_subtitle,
+                kickoff_ts=game_data.kickoff_ts,
+                halftime_ts=game_data.halftime_ts,
+            )
+            games.append(game)
 
         return games
 
-    def get_current_price(self, market_ticker: str) -> Optional[float]:
-        """Get current market price (favorite's probability)."""
-        try:
+    def _get_asks(self, market_ticker: str) -> tuple[int, int]:
+        """
+        Best (yes_ask, no_ask) in cents for a market, 0 where a side has no ask.
+
+        Reads the WebSocket snapshot when the feed is up; otherwise fetches over
+        REST through the exchange circuit breaker (missing data counts as a
+        failure), reusing the result for half a poll interval so the checkpoint,
+        entry and tick-logging paths share one HTTP call per ticker per tick.
+        """
+        if self.market_ws:
+            quote = self.market_ws.get_quote(market_ticker)
+            if quote:
+                return quote
+
+        cached = self._market_cache.get(market_ticker)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        def fetch_market():
             market = self.public_client.get_market(market_ticker)
-            if not market:
-                return None
+            if market is None:
+                raise RuntimeError(f"No market data for {market_ticker}")
+            return market
+
+        market = self._exchange_cb.call(fetch_market)
+        asks = self._asks_of(market)
+        self._market_cache[market_ticker] = (asks, time.monotonic() + self._quote_ttl)
+        return asks
+
+    @staticmethod
+    def _asks_of(market) -> tuple[int, int]:
+        """(yes_ask, no_ask) in cents from a MarketInfo, 0 where a side has no ask."""
+        return (
+            market.yes_ask if market.yes_ask is not None else 0,
+            market.no_ask if market.no_ask is not None else 0,
+        )
+
+    def _prefetch_asks(self, market_tickers: list[str]):
+        """
+        Warm the quote cache for several markets with one batched REST call, so the
+        per-game work that follows reads prices from memory instead of one GET each.
+        """
+        if self.market_ws:
+            market_tickers = [t for t in market_tickers if self.market_ws.get_quote(t) is None]
+        if not market_tickers:
+            return
+
+        try:
+            markets = self._exchange_cb.call(self.public_client.get_markets_by_ticker, market_tickers)
+        except Exception as e:
+            logger.debug("Batched quote prefetch failed, falling back to per-game fetches: %s", e)
+            return
+
+        expiry = time.monotonic() + self._quote_ttl
+        for market in markets:
+            self._market_cache[market.ticker] = (self._asks_of(market), expiry)
+
+    def _needs_quote(self, game: GameMonitor, now: int) -> bool:
+        """True if this tick's per-game work is expected to read the game's price."""
+        if now >= game.kickoff_ts:
+            return self.supabase.client is not None  # In-game price-tick logging
+        if game.odds_30m is not None:
+            return False
+        time_to_kickoff = game.kickoff_ts - now
+        return any(
+            time_to_kickoff <= window and getattr(game, odds_attr) is None
+            for odds_attr, _, _, window in self.CHECKPOINTS
+        )
 
+    def get_current_price(self, market_ticker: str) -> Optional[int]:
+        """Get current market price (favorite's ask in cents)."""
+        try:
             # Get best ask prices for both sides (price to BUY)
-            yes_ask = market.yes_ask if market.yes_ask is not None else 0
-            no_ask = market.no_ask if market.no_ask is not None else 0
+            yes_ask, no_ask = self._get_asks(market_ticker)
 
-            # Return the higher of the two (the favorite's probability)
+            # Return the higher of the two (the favorite's price)
             favorite_price = max(yes_ask, no_ask)
-            return favorite_price / 100.0 if favorite_price > 0 else None
+            return favorite_price if favorite_price > 0 else None
         except Exception as e:
-            logger.error(f"Error fetching price for {market_ticker}: {e}")
+            logger.error("Error fetching price for %s: %s", market_ticker, e)
             return None
 
     def get_favorite_side(self, market_ticker: str) -> Optional[str]:
         """Determine which side (yes/no) represents the favorite."""
         try:
-            market = self.public_client.get_market(market_ticker)
-            if not market:
-                return None
-
             # Get best ask prices for both sides (price to BUY)
-            yes_ask = market.yes_ask if market.yes_ask is not None else 0
-            no_ask = market.no_ask if market.no_ask is not None else 0
+            yes_ask, no_ask = self._get_asks(market_ticker)
 
             # Return the side with higher probability (the favorite)
             return "yes" if yes_ask >= no_ask else "no"
         except Exception as e:
-            logger.error(f"Error determining favorite side for {market_ticker}: {e}")
+            logger.error("Error determining favorite side for %s: %s", market_ticker, e)
             return None
 
-    def get_30day_volume(self, market_ticker: str) -> Optional[float]:
+    def get_favorite_quote(self, market_ticker: str) -> Optional[tuple[int, str]]:
+        """
+        Get the favorite's price and side from a single market fetch.
+
+        Returns:
+            (favorite_price_cents, favorite_side) or None if the market has no asks
+        """
+        try:
+            yes_ask, no_ask = self._get_asks(market_ticker)
+
+            favorite_price = max(yes_ask, no_ask)
+            if favorite_price <= 0:
+                return None
+            return favorite_price, "yes" if yes_ask >= no_ask else "no"
+        except Exception as e:
+            logger.error("Error fetching quote for %s: %s", market_ticker, e)
+            return None
+
+    def get_30day_volume(self, market_ticker: str, now: int) -> Optional[float]:
         """
         Get 30-day trading volume in USD for a market.
 
@@ -368,7 +752,6 @@ class LiveTrader:
         """
         try:
             # Calculate timestamp 30 days ago
-            now = int(datetime.utcnow().timestamp())
             thirty_days_ago = now - (30 * 24 * 3600)
 
             # Get trades from last 30 days
@@ -386,13 +769,11 @@ class LiveTrader:
             # For binary markets, each contract has $1 max payout
             # Volume = sum of (price * count) for all trades
             # Price is in cents, so divide by 100 to get dollars
-            total_volume_dollars = sum(
-                (trade.yes_price / 100.0) * trade.count
-                for trade in trades
-            )
-
             trade_count = len(trades)
-            contract_count = sum(trade.count for trade in trades)
+            prices = np.fromiter((trade.yes_price for trade in trades), dtype=np.int64, count=trade_count)
+            counts = np.fromiter((trade.count for trade in trades), dtype=np.int64, count=trade_count)
+            total_volume_dollars = float((prices * counts).sum()) / 100.0
+            contract_count = int(counts.sum())
 
             logger.info(f"  Volume check: {trade_count:,} trades, {contract_count:,} contracts, "
                        f"${total_volume_dollars:,.0f} volume (30d)")
@@ -409,60 +790,50 @@ class LiveTrader:
 
         Returns True if a checkpoint was captured.
         """
-        time_to_kickoff = game.kickoff_ts - now
-
-        # Define checkpoint windows (in seconds)
-        SIX_HOURS = 6 * 3600
-        THREE_HOURS = 3 * 3600
-        THIRTY_MIN = 30 * 60
-
-        # 6-hour checkpoint (within 6h-5.5h window)
-        if time_to_kickoff <= SIX_HOURS and game.odds_6h is None:
-            current_price = self.get_current_price(game.market_ticker)
-            if current_price:
-                game.odds_6h = current_price
-                game.checkpoint_6h_ts = now
-                game.pregame_prob = current_price  # Set legacy field
-                logger.info(f"  6h checkpoint: {current_price:.0%}")
-
-                # Update database
-                if self.supabase.client:
-                    self.supabase.update_game_checkpoint(game.market_ticker, 'odds_6h', current_price, now)
-                return True
-
-        # 3-hour checkpoint (within 3h-2.5h window)
-        elif time_to_kickoff <= THREE_HOURS and game.odds_3h is None:
-            current_price = self.get_current_price(game.market_ticker)
-            if current_price:
-                game.odds_3h = current_price
-                game.checkpoint_3h_ts = now
-                logger.info(f"  3h checkpoint: {current_price:.0%}")
-
-                # Update database
-                if self.supabase.client:
-                    self.supabase.update_game_checkpoint(game.market_ticker, 'odds_3h', current_price, now)
-                return True
-
-        # 30-min checkpoint (within 30min-25min window)
-        elif time_to_kickoff <= THIRTY_MIN and game.odds_30m is None:
-            current_price = self.get_current_price(game.market_ticker)
-            if current_price:
-                game.odds_30m = current_price
-                game.checkpoint_30m_ts = now
-                logger.info(f"  30m checkpoint: {current_price:.0%}")
+        # Nothing left to capture once the final checkpoint is in or the game has started
+        if game.odds_30m is not None or now >= game.kickoff_ts:
+            return False
 
-                # Determine final eligibility
-                self._determine_eligibility(game)
+        time_to_kickoff = game.kickoff_ts - now
 
-                # Update database
-                if self.supabase.client:
-                    self.supabase.update_game_checkpoint(game.market_ticker, 'odds_30m', current_price, now)
-                    self.supabase.update_game_eligibility(game.market_ticker, game.is_eligible)
-                return True
+        # First checkpoint whose window has opened and isn't captured yet
+        for odds_attr, ts_attr, label, window in self.CHECKPOINTS:
+            if time_to_kickoff <= window and getattr(game, odds_attr) is None:
+                break
+        else:
+            return False
 
-        return False
+        final = odds_attr == 'odds_30m'
+        if final:
+            # Same market fetch gives us the favorite side for entry
+            quote = self.get_favorite_quote(game.market_ticker)
+            if not quote:
+                return False
+            current_price_cents, game.position_side = quote
+        else:
+            current_price_cents = self.get_current_price(game.market_ticker)
+            if not current_price_cents:
+                return False
+
+        setattr(game, odds_attr, current_price_cents)
+        setattr(game, ts_attr, now)
+        if odds_attr == 'odds_6h':
+            game.pregame_prob = current_price_cents  # Set legacy field
+        logger.info("  %s checkpoint: %s¢", label, current_price_cents)
+
+        if final:
+            # Determine final eligibility
+            self._determine_eligibility(game, now)
+
+        self._save_game_state(game)
+
+        # Update database
+        self._db_submit('update_game_checkpoint', game.market_ticker, odds_attr, cents_to_prob(current_price_cents), now)
+        if final:
+            self._db_submit('update_game_eligibility', game.market_ticker, game.is_eligible)
+        return True
 
-    def _determine_eligibility(self, game: GameMonitor):
+    def _determine_eligibility(self, game: GameMonitor, now: int):
         """
         Determine if game is eligible for trading based on checkpoint rules.
 
@@ -471,32 +842,38 @@ class LiveTrader:
         - BUT if odds_30m < 57% → Override to NOT eligible (final veto)
         - AND if 30-day volume < threshold → Override to NOT eligible (volume veto)
         """
-        threshold = 0.57
+        threshold_cents = 57
 
         # Get volume threshold from config (with fallback if not set)
-        volume_threshold = self.config['trading'].get('volume_threshold_usd', 50000)
+        volume_threshold = self._volume_threshold_usd
+
+        # Final veto: if 30m checkpoint < 57%, not eligible
+        if game.odds_30m is not None and game.odds_30m < threshold_cents:
+            game.is_eligible = False
+            logger.info("  → NOT ELIGIBLE (30m veto: %s¢ < %s¢)", game.odds_30m, threshold_cents)
+            return
 
         # Check if any checkpoint >= 57%
         checkpoint_odds = [game.odds_6h, game.odds_3h, game.odds_30m]
-        has_high_checkpoint = any(odds and odds >= threshold for odds in checkpoint_odds if odds is not None)
+        has_high_checkpoint = any(odds is not None and odds >= threshold_cents for odds in checkpoint_odds)
 
-        # Check volume (at 30m checkpoint)
-        volume = self.get_30day_volume(game.market_ticker)
+        # Check volume (at 30m checkpoint) - only once the 30m veto has passed,
+        # since it pages through 30 days of trades
+        volume = self.get_30day_volume(game.market_ticker, now)
 
-        # Final veto: if 30m checkpoint < 57%, not eligible
-        if game.odds_30m is not None and game.odds_30m < threshold:
-            game.is_eligible = False
-            logger.info(f"  → NOT ELIGIBLE (30m veto: {game.odds_30m:.0%} < 57%)")
         # Volume veto: if volume too low, not eligible
-        elif volume is not None and volume < volume_threshold:
+        if volume is not None and volume < volume_threshold:
             game.is_eligible = False
             logger.info(f"  → NOT ELIGIBLE (low volume: ${volume:,.0f} < ${volume_threshold:,.0f})")
         elif has_high_checkpoint:
             game.is_eligible = True
-            logger.info(f"  → ELIGIBLE (checkpoint(s) >= 57%, volume ${volume:,.0f})")
+            if volume is not None:
+                logger.info(f"  → ELIGIBLE (checkpoint(s) >= 57%, volume ${volume:,.0f})")
+            else:
+                logger.info("  → ELIGIBLE (checkpoint(s) >= 57%, volume unavailable)")
         else:
             game.is_eligible = False
-            logger.info(f"  → NOT ELIGIBLE (no checkpoint >= 57%)")
+            logger.info("  → NOT ELIGIBLE (no checkpoint >= 57%)")
 
     def calculate_position_sizes(
         self,
@@ -504,42 +881,33 @@ class LiveTrader:
         kelly_frac: float,
         max_exposure: float,
         current_price_cents: int,
-        levels_to_hit: list[dict],
-    ) -> list[tuple[int, int]]:
-        """Calculate position sizes with Kelly criterion and exposure limits."""
-        ideal_positions = []
-        total_ideal_capital = 0
-
-        for level in levels_to_hit:
-            price_dollars = level['trigger'] / 100.0
-            base_size = int((bankroll * kelly_frac) / price_dollars)
-            actual_size = max(1, int(base_size * level['kelly_mult']))
-
-            ideal_capital = actual_size * price_dollars
-            total_ideal_capital += ideal_capital
-
-            ideal_positions.append({
-                'trigger': level['trigger'],
-                'ideal_size': actual_size,
-                'ideal_capital': ideal_capital
-            })
+        trigger_cents: np.ndarray,
+        kelly_mult: np.ndarray,
+    ) -> list[tuple[int, int, float]]:
+        """
+        Calculate position sizes with Kelly criterion and exposure limits.
 
+        trigger_cents and kelly_mult are parallel arrays, one entry per ladder level.
+
+        Returns:
+            List of (price_cents, size, capital_dollars) tuples
+        """
+        price_dollars = trigger_cents / 100.0
+        base_size = ((bankroll * kelly_frac) / price_dollars).astype(np.int64)
+        sizes = np.maximum(1, (base_size * kelly_mult).astype(np.int64))
+
+        total_ideal_capital = float((sizes * price_dollars).sum())
         max_capital_allowed = bankroll * max_exposure
 
-        if total_ideal_capital <= max_capital_allowed:
-            return [(p['trigger'], p['ideal_size']) for p in ideal_positions]
-        else:
+        if total_ideal_capital > max_capital_allowed:
             scale_factor = max_capital_allowed / total_ideal_capital
-            scaled_positions = []
-            for pos in ideal_positions:
-                scaled_size = max(1, int(pos['ideal_size'] * scale_factor))
-                scaled_positions.append((pos['trigger'], scaled_size))
-            return scaled_positions
+            sizes = np.maximum(1, (sizes * scale_factor).astype(np.int64))
 
-    def check_entry_signal(self, game: GameMonitor) -> bool:
-        """Check if we should enter a position for this game."""
-        now = int(datetime.utcnow().timestamp())
+        capital = sizes * trigger_cents / 100.0
+        return list(zip(trigger_cents.tolist(), sizes.tolist(), capital.tolist()))
 
+    def check_entry_signal(self, game: GameMonitor, now: int) -> bool:
+        """Check if we should enter a position for this game."""
         if now >= game.kickoff_ts:
             return False
 
@@ -558,60 +926,66 @@ class LiveTrader:
     def enter_position(self, game: GameMonitor):
         """Enter position with limit order ladder strategy."""
         logger.info("=" * 80)
-        logger.info(f"ENTRY SIGNAL: {game.market_title} ({game.yes_subtitle})")
+        logger.info("ENTRY SIGNAL: %s (%s)", game.market_title, game.yes_subtitle)
         logger.info("=" * 80)
 
-        current_price = self.get_current_price(game.market_ticker)
-        if current_price is None:
-            logger.error("Could not get current price, skipping")
-            return
-
-        # Determine which side to buy (yes or no) - we always want the FAVORITE
-        favorite_side = self.get_favorite_side(game.market_ticker)
-        if favorite_side is None:
-            logger.error("Could not determine favorite side, skipping")
-            return
-
-        current_price_cents = int(current_price * 100)
+        if game.position_side and game.odds_30m:
+            # Side and price were captured at the 30m checkpoint - no refetch needed
+            current_price_cents = game.odds_30m
+            favorite_side = game.position_side
+        else:
+            # Price and side to buy (yes or no - we always want the FAVORITE) from one market read
+            quote = self.get_favorite_quote(game.market_ticker)
+            if quote is None:
+                logger.error("Could not get current price, skipping")
+                return
+            current_price_cents, favorite_side = quote
 
-        logger.info(f"Pregame: {game.pregame_prob:.0%} → Current: {current_price:.0%}")
-        logger.info(f"Buying {favorite_side.upper()} (the favorite)")
-        logger.info(f"Placing limit order ladder (Kalshi will fill as price drops)")
+        logger.info("Pregame: %s¢ → Current: %s¢", game.pregame_prob, current_price_cents)
+        logger.info("Buying %s (the favorite)", favorite_side.upper())
+        logger.info("Placing limit order ladder (Kalshi will fill as price drops)")
 
         # Use ALL scaling levels from config (don't filter by current price)
-        scaling_levels = self.config['trading']['scaling_levels']
-
-        logger.info(f"Limit orders to place: {len(scaling_levels)} levels")
+        logger.info("Limit orders to place: %s levels", len(self._trigger_cents))
 
         positions = self.calculate_position_sizes(
             self.bankroll,
-            self.config['trading']['kelly_fraction'],
-            self.config['trading']['max_exposure_pct'],
+            self._kelly_fraction,
+            self._max_exposure_pct,
             current_price_cents,
-            scaling_levels  # Use ALL levels, not filtered by current price
+            self._trigger_cents,  # Use ALL levels, not filtered by current price
+            self._kelly_mult,
         )
 
-        total_capital = sum(price * size / 100.0 for price, size in positions)
+        total_capital = sum(capital for _, _, capital in positions)
         logger.info(f"Total capital at risk: ${total_capital:,.2f}")
 
         # Calculate max allowed exposure dynamically from bankroll × max_exposure_pct
-        max_allowed_exposure = self.bankroll * self.config['trading']['max_exposure_pct']
-        logger.info(f"Max allowed exposure: ${max_allowed_exposure:,.2f} ({self.config['trading']['max_exposure_pct']*100:.0f}% of ${self.bankroll:,.2f})")
+        max_allowed_exposure = self.bankroll * self._max_exposure_pct
+        logger.info(f"Max allowed exposure: ${max_allowed_exposure:,.2f} ({self._max_exposure_pct*100:.0f}% of ${self.bankroll:,.2f})")
 
         if total_capital > max_allowed_exposure:
             logger.warning(f"⚠️  Total exposure ${total_capital:,.2f} exceeds limit ${max_allowed_exposure:,.2f}, skipping")
             return
 
-        for price_cents, size in positions:
-            logger.info(f"  Level: {size:4d} contracts @ {price_cents}¢ = ${price_cents * size / 100:.2f}")
+        # Exit price for every ladder level, computed once rather than per fill
+        if game.pregame_prob:
+            game.exit_price_cents = {
+                price_cents: self._measured_move_exit_cents(game.pregame_prob, price_cents)
+                for price_cents, _, _ in positions
+            }
+
+        for price_cents, size, capital in positions:
+            logger.info("  Level: %4d contracts @ %d¢ = $%.2f", size, price_cents, capital)
 
-            if self.config['risk']['dry_run']:
+            if self._dry_run:
                 logger.info("  [DRY RUN] Would place order here")
                 order_id = f"dry_run_{len(game.order_ids)}"
                 game.order_ids.append(order_id)
             else:
                 try:
-                    order = self.trading_client.place_order(
+                    order = self._exchange_cb.call(
+                        self.trading_client.place_order,
                         market_ticker=game.market_ticker,
                         side=favorite_side,  # Buy the favorite side (yes or no)
                         action="buy",
@@ -619,11 +993,11 @@ class LiveTrader:
                         price=price_cents,
                         order_type="limit"
                     )
-                    logger.info(f"  ✓ Order placed: {order.order_id} (status: {order.status})")
+                    logger.info("  ✓ Order placed: %s (status: %s)", order.order_id, order.status)
 
                     # Check if order filled immediately
                     if order.status == "executed":
-                        logger.info(f"  🎉 IMMEDIATE FILL: {size} contracts @ {price_cents}¢")
+                        logger.info("  🎉 IMMEDIATE FILL: %s contracts @ %s¢", size, price_cents)
                         # Create position immediately (don't add to pending orders)
                         position = Position(
                             market_ticker=game.market_ticker,
@@ -633,20 +1007,16 @@ class LiveTrader:
                             entry_time=int(time.time()),
                             order_id=order.order_id
                         )
-                        game.positions.append(position)
+                        self._add_position(game, position)
 
                         # Log position to dashboard
-                        if self.supabase.client:
-                            try:
-                                self.supabase.log_position_entry({
-                                    'market_ticker': game.market_ticker,
-                                    'entry_price': price_cents,
-                                    'size': size,
-                                    'entry_time': int(time.time()),
-                                    'order_id': order.order_id
-                                })
-                            except Exception as db_error:
-                                logger.error(f"    ✗ Failed to log position to dashboard: {db_error}")
+                        self._db_submit('log_position_entry', {
+                            'market_ticker': game.market_ticker,
+                            'entry_price': price_cents,
+                            'size': size,
+                            'entry_time': int(time.time()),
+                            'order_id': order.order_id
+                        })
 
                         # IMMEDIATELY place exit order at 55¢ (bracket strategy)
                         self._place_exit_order(game, position)
@@ -655,30 +1025,48 @@ class LiveTrader:
                         game.order_ids.append(order.order_id)
 
                         # Log order to dashboard (NOT position - that happens when order fills)
-                        if self.supabase.client:
-                            self.supabase.log_order(
-                                market_ticker=game.market_ticker,
-                                order_id=order.order_id,
-                                price=price_cents,
-                                size=size,
-                                side='buy'
-                            )
+                        self._db_submit(
+                            'log_order',
+                            market_ticker=game.market_ticker,
+                            order_id=order.order_id,
+                            price=price_cents,
+                            size=size,
+                            side='buy'
+                        )
 
                 except Exception as e:
-                    logger.error(f"  ✗ Error placing order: {e}")
+                    logger.error("  ✗ Error placing order: %s", e)
 
         game.triggered = True
         game.position_side = favorite_side  # Store which side we're trading
         game.highest_entry = max(p[0] for p in positions)
         self.total_exposure += total_capital
+        self._save_game_state(game)
 
         # Update game status to triggered
-        if self.supabase.client:
-            self.supabase.update_game_status(game.market_ticker, 'triggered', game.pregame_prob)
+        self._db_submit('update_game_status', game.market_ticker, 'triggered', cents_to_prob(game.pregame_prob))
 
         logger.info(f"Orders placed. Total potential exposure: ${self.total_exposure:,.2f}")
         logger.info("")
 
+    def _add_position(self, game: GameMonitor, position: Position):
+        """Record a filled position, counting the game's first one toward the concurrency limit."""
+        with self._state_lock:
+            if not game.positions:
+                self._games_with_positions += 1
+            game.positions.append(position)
+
+    def _clear_positions(self, game: GameMonitor):
+        """Drop a game's positions once it is flat."""
+        with self._state_lock:
+            if game.positions:
+                self._games_with_positions -= 1
+            game.positions.clear()
+
+    def _measured_move_exit_cents(self, pregame_cents: int, entry_cents: int) -> int:
+        """Exit price = entry + (pregame - entry) * revert_fraction, in cents."""
+        return entry_cents + int((pregame_cents - entry_cents) * self._revert_fraction)
+
     def _place_exit_order(self, game: GameMonitor, position: Position):
         """
         Place exit order using measured move strategy.
@@ -688,18 +1076,20 @@ class LiveTrader:
             logger.warning("No pregame probability available, cannot calculate exit price")
             return
 
-        revert_fraction = self.config['trading'].get('revert_fraction', 0.50)
+        revert_fraction = self._revert_fraction
 
         # Measured move formula: expect partial revert of the total drop
-        pregame_cents = int(game.pregame_prob * 100)
+        pregame_cents = game.pregame_prob
         drop_cents = pregame_cents - position.entry_price
-        expected_revert_cents = int(drop_cents * revert_fraction)
-        exit_price_cents = position.entry_price + expected_revert_cents
+        exit_price_cents = game.exit_price_cents.get(position.entry_price)
+        if exit_price_cents is None:  # Filled off the precomputed ladder
+            exit_price_cents = self._measured_move_exit_cents(pregame_cents, position.entry_price)
+        expected_revert_cents = exit_price_cents - position.entry_price
 
-        logger.info(f"  → Placing exit order: {position.size} contracts @ {exit_price_cents}¢")
+        logger.info("  → Placing exit order: %s contracts @ %s¢", position.size, exit_price_cents)
         logger.info(f"     Measured move: {position.entry_price}¢ entry + {expected_revert_cents}¢ revert ({revert_fraction:.0%} of {drop_cents}¢ drop)")
 
-        if self.config['risk']['dry_run']:
+        if self._dry_run:
             logger.info("    [DRY RUN] Would place exit order here")
             position.exit_order_id = f"dry_run_exit_{position.order_id}"
             return
@@ -707,6 +1097,8 @@ class LiveTrader:
         if not self.trading_client:
             return
 
+        # Exit sells bypass the circuit breaker (like cancels): they reduce risk, and a
+        # market-data outage must not leave a filled position without its exit
         try:
             exit_order = self.trading_client.place_order(
                 market_ticker=game.market_ticker,
@@ -717,34 +1109,37 @@ class LiveTrader:
                 order_type="limit"
             )
             position.exit_order_id = exit_order.order_id
-            logger.info(f"    ✓ Exit order placed: {exit_order.order_id}")
+            logger.info("    ✓ Exit order placed: %s", exit_order.order_id)
+            self._save_game_state(game)
 
         except Exception as e:
-            logger.error(f"    ✗ Error placing exit order: {e}")
+            logger.error("    ✗ Error placing exit order: %s", e)
 
     def check_order_fills(self, game: GameMonitor):
         """Check if any pending orders have filled and convert them to positions."""
-        if not game.order_ids or self.config['risk']['dry_run']:
+        if not game.order_ids or self._dry_run:
             return
 
         if not self.trading_client:
             return
 
-        logger.info(f"Checking {len(game.order_ids)} pending order(s) for {game.market_ticker}")
+        logger.info("Checking %d pending order(s) for %s", len(game.order_ids), game.market_ticker)
         filled_orders = []
+        position_order_ids = {p.order_id for p in game.positions}  # Orders that already have a position
+        positions_before = len(position_order_ids)
 
         for order_id in game.order_ids:
             try:
-                logger.info(f"  Checking order status: {order_id}")
+                logger.debug("  Checking order status: %s", order_id)
                 status_response = self.trading_client.get_order_status(order_id)
 
                 # None means 404 - could be race condition, DON'T remove order
                 if status_response is None:
-                    logger.debug(f"  Order {order_id} returned 404 (race condition or recently executed) - keeping in pending list")
+                    logger.debug("  Order %s returned 404 (race condition or recently executed) - keeping in pending list", order_id)
                     continue
 
                 if not status_response or 'order' not in status_response:
-                    logger.error(f"  ✗ Invalid response for order {order_id}: {status_response}")
+                    logger.error("  ✗ Invalid response for order %s: %s", order_id, status_response)
                     continue
 
                 order_status = status_response.get('order', {})
@@ -754,42 +1149,33 @@ class LiveTrader:
                 total_count = order_status.get('count', 0)
                 price = order_status.get('yes_price') or order_status.get('no_price', 0)
 
-                logger.info(f"    Status: {status}, Filled: {filled_count}/{total_count} @ {price}¢")
+                logger.debug("    Status: %s, Filled: %s/%s @ %s¢", status, filled_count, total_count, price)
 
                 # Handle "executed" status (Kalshi sometimes returns this instead of "filled")
                 # When status is "executed" but filled_count is 0, query Supabase for original order size
                 if status == 'executed' and filled_count == 0:
-                    logger.info(f"    Order status is 'executed' but filled_count=0 - querying Supabase for order size")
+                    logger.info("    Order status is 'executed' but filled_count=0 - querying Supabase for order size")
                     if self.supabase.client:
                         order_record = self.supabase.get_order(order_id)
                         if order_record:
                             filled_count = order_record['size']
                             total_count = order_record['size']
                             price = order_record['price']
-                            logger.info(f"    Retrieved from database: {filled_count} contracts @ {price}¢")
+                            logger.info("    Retrieved from database: %s contracts @ %s¢", filled_count, price)
                         else:
-                            logger.error(f"    Could not find order in database: {order_id}")
+                            logger.error("    Could not find order in database: %s", order_id)
                             continue
 
                 # Update order status in database
-                if self.supabase.client:
-                    try:
-                        if status == 'filled' or status == 'executed':
-                            self.supabase.update_order_status(order_id, 'filled', filled_count)
-                        elif filled_count > 0 and filled_count < total_count:
-                            self.supabase.update_order_status(order_id, 'partially_filled', filled_count)
-                    except Exception as db_error:
-                        logger.error(f"    ✗ Failed to update dashboard for order {order_id}: {db_error}")
+                if status == 'filled' or status == 'executed':
+                    self._submit_order_status([order_id], 'filled', filled_count)
+                elif filled_count > 0 and filled_count < total_count:
+                    self._submit_order_status([order_id], 'partially_filled', filled_count)
 
                 # Create position for filled orders (handle both "filled" and "executed" status)
                 if filled_count > 0 or status == 'executed':
                     # Check if we already created a position for this order
-                    existing_position = next(
-                        (p for p in game.positions if p.order_id == order_id),
-                        None
-                    )
-
-                    if not existing_position:
+                    if order_id not in position_order_ids:
                         position = Position(
                             market_ticker=game.market_ticker,
                             side=game.position_side,  # Use the side we determined at entry
@@ -798,21 +1184,18 @@ class LiveTrader:
                             entry_time=int(time.time()),
                             order_id=order_id
                         )
-                        game.positions.append(position)
-                        logger.info(f"  ✓ NEW FILL: {filled_count} contracts @ {price}¢ (Order: {order_id})")
+                        self._add_position(game, position)
+                        position_order_ids.add(order_id)
+                        logger.info("  ✓ NEW FILL: %s contracts @ %s¢ (Order: %s)", filled_count, price, order_id)
 
                         # Log position to dashboard
-                        if self.supabase.client:
-                            try:
-                                self.supabase.log_position_entry({
-                                    'market_ticker': game.market_ticker,
-                                    'entry_price': price,
-                                    'size': filled_count,
-                                    'entry_time': int(time.time()),
-                                    'order_id': order_id
-                                })
-                            except Exception as db_error:
-                                logger.error(f"    ✗ Failed to log position to dashboard: {db_error}")
+                        self._db_submit('log_position_entry', {
+                            'market_ticker': game.market_ticker,
+                            'entry_price': price,
+                            'size': filled_count,
+                            'entry_time': int(time.time()),
+                            'order_id': order_id
+                        })
 
                         # IMMEDIATELY place exit order at 55¢ (bracket strategy)
                         self._place_exit_order(game, position)
@@ -822,16 +1205,19 @@ class LiveTrader:
                 if status == 'filled' or status == 'executed':
                     filled_orders.append(order_id)
 
-            except Exception as e:
-                logger.error(f"  ✗ ERROR checking order status for {order_id}: {e}")
-                import traceback
-                logger.error(f"    Traceback: {traceback.format_exc()}")
+            except Exception:
+                logger.exception("  ✗ ERROR checking order status for %s", order_id)
 
-        # Remove fully filled orders from pending list
-        for order_id in filled_orders:
-            if order_id in game.order_ids:
-                game.order_ids.remove(order_id)
-                logger.info(f"  Removed fully filled order from pending list: {order_id}")
+        # Remove fully filled orders from pending list (single pass, set membership)
+        if filled_orders:
+            filled_set = set(filled_orders)
+            game.order_ids = [oid for oid in game.order_ids if oid not in filled_set]
+            if logger.isEnabledFor(logging.INFO):
+                for order_id in filled_orders:
+                    logger.info("  Removed fully filled order from pending list: %s", order_id)
+
+        if filled_orders or len(position_order_ids) > positions_before:
+            self._save_game_state(game)
 
 
     def exit_position_at_halftime(self, game: GameMonitor):
@@ -843,22 +1229,21 @@ class LiveTrader:
         logger.info(f"HALFTIME EXIT: {game.market_title}")
         logger.info("=" * 80)
 
-        current_price = self.get_current_price(game.market_ticker)
-        if current_price is None:
+        current_price_cents = self.get_current_price(game.market_ticker)
+        if current_price_cents is None:
             logger.error("Could not get current price, skipping halftime exit")
             return
 
-        current_price_cents = int(current_price * 100)
-
         logger.info(f"Placing LIMIT exit orders at {current_price_cents}¢ (maker only)")
 
         for position in game.positions:
-            if self.config['risk']['dry_run']:
+            if self._dry_run:
                 logger.info(f"  [DRY RUN] Would place limit sell: {position.size} @ {current_price_cents}¢")
                 order_id = f"dry_run_exit_{position.order_id}"
                 game.exit_order_ids.append(order_id)
             else:
                 try:
+                    # Bypasses the circuit breaker, like the other risk-reducing calls
                     order = self.trading_client.place_order(
                         market_ticker=game.market_ticker,
                         side=position.side,
@@ -881,14 +1266,19 @@ class LiveTrader:
         logger.info("Halftime exit orders placed. Waiting for fills...")
         logger.info("")
 
-    def _cancel_exit_orders(self, game: GameMonitor):
-        """Cancel all pending exit orders (55¢ sells) for this game."""
+    def _cancel_exit_orders(self, game: GameMonitor, results: Optional[dict] = None):
+        """
+        Cancel all pending exit orders (55¢ sells) for this game.
+
+        Args:
+            results: Outcomes from a cancel_orders_batch call already made for these orders
+        """
         exit_orders = [p.exit_order_id for p in game.positions if p.exit_order_id]
 
         if not exit_orders:
             return
 
-        if self.config['risk']['dry_run']:
+        if self._dry_run:
             logger.info(f"[DRY RUN] Would cancel {len(exit_orders)} pending exit order(s)")
             for position in game.positions:
                 position.exit_order_id = None
@@ -898,6 +1288,9 @@ class LiveTrader:
             return
 
         logger.info(f"Cancelling {len(exit_orders)} pending exit order(s)")
+        # Cancels bypass the circuit breaker: pulling orders is how we shed risk during an outage
+        if results is None:
+            results = self.trading_client.cancel_orders_batch(exit_orders)
         cancelled_count = 0
         failed_count = 0
 
@@ -905,24 +1298,28 @@ class LiveTrader:
             if not position.exit_order_id:
                 continue
 
-            try:
-                logger.info(f"  Cancelling exit order: {position.exit_order_id}")
-                self.trading_client.cancel_order(position.exit_order_id)
+            error = results.get(position.exit_order_id, "no result")
+            if error is None:
                 logger.info(f"  ✓ Exit order cancelled: {position.exit_order_id}")
                 cancelled_count += 1
                 position.exit_order_id = None
-            except Exception as e:
-                logger.error(f"  ✗ Failed to cancel exit order {position.exit_order_id}: {e}")
+            else:
+                logger.error(f"  ✗ Failed to cancel exit order {position.exit_order_id}: {error}")
                 failed_count += 1
 
         logger.info(f"Exit order cancellation complete: {cancelled_count} cancelled, {failed_count} failed")
 
-    def cancel_pending_orders(self, game: GameMonitor):
-        """Cancel all unfilled orders for this game."""
+    def cancel_pending_orders(self, game: GameMonitor, results: Optional[dict] = None):
+        """
+        Cancel all unfilled orders for this game.
+
+        Args:
+            results: Outcomes from a cancel_orders_batch call already made for these orders
+        """
         if not game.order_ids:
             return
 
-        if self.config['risk']['dry_run']:
+        if self._dry_run:
             logger.info(f"[DRY RUN] Would cancel {len(game.order_ids)} pending order(s)")
             game.order_ids.clear()
             return
@@ -931,33 +1328,30 @@ class LiveTrader:
             return
 
         logger.info(f"Cancelling {len(game.order_ids)} pending order(s) for {game.market_ticker}")
-        cancelled_count = 0
+        if results is None:
+            results = self.trading_client.cancel_orders_batch(game.order_ids)
+        cancelled = []
         failed_count = 0
 
-        for order_id in list(game.order_ids):  # Use list() to avoid modifying during iteration
-            try:
-                logger.info(f"  Cancelling order: {order_id}")
-                self.trading_client.cancel_order(order_id)
+        for order_id in game.order_ids:
+            error = results.get(order_id, "no result")
+            if error is None:
                 logger.info(f"  ✓ Order cancelled: {order_id}")
-                cancelled_count += 1
-
-                # Update dashboard
-                if self.supabase.client:
-                    try:
-                        self.supabase.update_order_status(order_id, 'cancelled', 0)
-                    except Exception as db_error:
-                        logger.error(f"    ✗ Failed to update dashboard for cancelled order: {db_error}")
-
-            except Exception as e:
-                logger.error(f"  ✗ Failed to cancel order {order_id}: {e}")
+                cancelled.append(order_id)
+            else:
+                logger.error(f"  ✗ Failed to cancel order {order_id}: {error}")
                 failed_count += 1
+        cancelled_count = len(cancelled)
+
+        # Update dashboard in one write
+        if cancelled:
+            self._submit_order_status(cancelled, 'cancelled', 0)
 
         # Clear the order IDs list
         game.order_ids.clear()
+        self._save_game_state(game)
         logger.info(f"Order cancellation complete: {cancelled_count} cancelled, {failed_count} failed")
 
-
-
     def monitor_exit_orders(self, game: GameMonitor) -> bool:
         """
         Monitor exit sell orders and calculate P&L when they fill.
@@ -968,10 +1362,10 @@ class LiveTrader:
         if not game.exit_order_ids:
             return False
 
-        if self.config['risk']['dry_run']:
+        if self._dry_run:
             # In dry run, immediately mark as filled
-            logger.info(f"[DRY RUN] Exit orders filled")
-            game.positions.clear()
+            logger.info("[DRY RUN] Exit orders filled")
+            self._clear_positions(game)
             game.exit_order_ids.clear()
             game.exiting = False
             return True
@@ -979,11 +1373,12 @@ class LiveTrader:
         if not self.trading_client:
             return False
 
-        logger.info(f"Monitoring {len(game.exit_order_ids)} exit order(s) for {game.market_ticker}")
+        logger.info("Monitoring %s exit order(s) for %s", len(game.exit_order_ids), game.market_ticker)
 
         all_filled = True
         filled_orders = []
         total_pnl = 0.0
+        positions_by_exit_order = {p.exit_order_id: p for p in game.positions if p.exit_order_id}
 
         for order_id in game.exit_order_ids:
             try:
@@ -991,12 +1386,12 @@ class LiveTrader:
 
                 # 404 means order executed/cancelled
                 if status_response is None:
-                    logger.info(f"  ✓ Exit order {order_id} filled (removed from active orders)")
+                    logger.info("  ✓ Exit order %s filled (removed from active orders)", order_id)
                     filled_orders.append(order_id)
                     continue
 
                 if not status_response or 'order' not in status_response:
-                    logger.warning(f"  ⚠️  Invalid response for exit order {order_id}")
+                    logger.warning("  ⚠️  Invalid response for exit order %s", order_id)
                     all_filled = False
                     continue
 
@@ -1010,51 +1405,47 @@ class LiveTrader:
                 no_price = order_status.get('no_price')
                 fill_price = yes_price if yes_price is not None else no_price
 
-                logger.info(f"  Exit order {order_id}: {status}, Filled: {filled_count}/{total_count}")
+                logger.info("  Exit order %s: %s, Filled: %s/%s", order_id, status, filled_count, total_count)
 
                 # Check if filled
                 if status == 'filled' or status == 'executed':
                     # Find corresponding position to calculate P&L and mark as exited
-                    for position in game.positions:
-                        # Match position to exit order by size (approximate)
-                        if position.size == total_count and position.exit_order_id == order_id:
-                            if fill_price:
-                                pnl = ((fill_price - position.entry_price) / 100.0) * position.size
-                                total_pnl += pnl
-                                logger.info(f"    Position {position.size} @ {position.entry_price}¢ → {fill_price}¢ = ${pnl:+.2f}")
-                            # Mark position as exited by setting size to 0
-                            position.size = 0
-                            break
+                    position = positions_by_exit_order.get(order_id)
+                    # Match position to exit order by size (approximate)
+                    if position is not None and position.size == total_count:
+                        if fill_price:
+                            pnl = ((fill_price - position.entry_price) / 100.0) * position.size
+                            total_pnl += pnl
+                            logger.info("    Position %s @ %s¢ → %s¢ = $%+.2f", position.size, position.entry_price, fill_price, pnl)
+                        # Mark position as exited by setting size to 0
+                        position.size = 0
 
                     filled_orders.append(order_id)
 
                     # Update order status in database
-                    if self.supabase.client:
-                        try:
-                            self.supabase.update_order_status(order_id, 'filled', filled_count)
-                        except Exception as db_error:
-                            logger.error(f"    ✗ Failed to update order status: {db_error}")
+                    self._submit_order_status([order_id], 'filled', filled_count)
                 else:
                     # Order still pending
                     all_filled = False
 
             except Exception as e:
-                logger.error(f"  ✗ Error checking exit order {order_id}: {e}")
+                logger.error("  ✗ Error checking exit order %s: %s", order_id, e)
                 all_filled = False
 
         # Remove filled orders from tracking list
-        for order_id in filled_orders:
-            if order_id in game.exit_order_ids:
-                game.exit_order_ids.remove(order_id)
+        if filled_orders:
+            filled_set = set(filled_orders)
+            game.exit_order_ids = [oid for oid in game.exit_order_ids if oid not in filled_set]
 
         # If all orders filled, finalize the exit
         if all_filled and not game.exit_order_ids:
             logger.info("=" * 80)
-            logger.info(f"ALL EXIT ORDERS FILLED: {game.market_title}")
+            logger.info("ALL EXIT ORDERS FILLED: %s", game.market_title)
             logger.info("=" * 80)
 
-            old_bankroll = self.bankroll
-            self.bankroll += total_pnl
+            with self._state_lock:
+                old_bankroll = self.bankroll
+                self.bankroll += total_pnl
 
             logger.info(f"Total P&L: ${total_pnl:+,.2f}")
             logger.info(f"Bankroll: ${old_bankroll:,.2f} → ${self.bankroll:,.2f}")
@@ -1066,10 +1457,10 @@ class LiveTrader:
                 avg_exit_price = None
                 if game.positions:
                     # We don't have exact exit prices per position, use current market price as approximation
-                    current_price = self.get_current_price(game.market_ticker)
-                    avg_exit_price = int(current_price * 100) if current_price else 50
+                    avg_exit_price = self.get_current_price(game.market_ticker) or 50
 
-                self.supabase.log_position_exit(
+                self._db_submit(
+                    'log_position_exit',
                     market_ticker=game.market_ticker,
                     exit_price=avg_exit_price,
                     exit_time=int(time.time()),
@@ -1077,7 +1468,8 @@ class LiveTrader:
                 )
 
                 # Log bankroll change
-                self.supabase.log_bankroll_change(
+                self._db_submit(
+                    'log_bankroll_change',
                     timestamp=int(time.time()),
                     new_amount=self.bankroll,
                     change=total_pnl,
@@ -1085,15 +1477,183 @@ class LiveTrader:
                 )
 
                 # Update game status to completed
-                self.supabase.update_game_status(game.market_ticker, 'completed')
+                self._db_submit('update_game_status', game.market_ticker, 'completed')
 
             # Clear positions and reset flags
-            game.positions.clear()
+            self._clear_positions(game)
             game.exiting = False
             return True  # Game can be removed
 
         return False  # Still waiting for exits to fill
 
+    def _handle_halftime(self, games: list[GameMonitor]):
+        """
+        Halftime timeout for every game due this tick - ONLY CANCEL ORDERS, NO SELLING
+        (manual exit if needed). Games that hit halftime together share one batch cancel.
+        """
+        for game in games:
+            total_position_size = sum(p.size for p in game.positions) if game.positions else 0
+            logger.info("=" * 80)
+            logger.info("HALFTIME TIMEOUT: %s (Position size: %s contracts)", game.market_title, total_position_size)
+            logger.info("CANCELLING ORDERS ONLY - Manual exit required if position open")
+            logger.info("=" * 80)
+
+        # Cancel ALL orders (buy and exit) across the slate in one request
+        results = None
+        if not self._dry_run and self.trading_client:
+            order_ids = [oid for game in games for oid in game.order_ids]
+            order_ids += [p.exit_order_id for game in games for p in game.positions if p.exit_order_id]
+            if order_ids:
+                results = self.trading_client.cancel_orders_batch(order_ids)
+
+        for game in games:
+            if game.order_ids:
+                self.cancel_pending_orders(game, results)
+            self._cancel_exit_orders(game, results)
+
+            # DISABLED: Automatic halftime selling (causing issues with stale position data)
+            # Will manually exit positions if needed
+            # self.exit_position_at_halftime(game)
+
+            # Mark as exiting to prevent re-triggering
+            game.exiting = True
+
+    def _tick_game(self, game: GameMonitor, now: int, log_status: bool, exchange_down: bool) -> bool:
+        """
+        Run one tick of checks for a single game (called from the game worker pool).
+
+        Returns:
+            True if the game is finished and can be removed from active_games
+        """
+        # Log game status periodically (every minute)
+        if log_status:
+            pending_count = len(game.order_ids) if game.order_ids else 0
+            position_count = len(game.positions) if game.positions else 0
+            logger.info("[%s] Status: triggered=%s, pending_orders=%s, positions=%s", game.market_ticker, game.triggered, pending_count, position_count)
+
+        # Halftime timeouts are handled by run() off the halftime heap before this is called
+
+        # Check and capture checkpoints (6h, 3h, 30m before kickoff)
+        self.check_and_capture_checkpoint(game, now)
+
+        # Log price tick ONLY for in-game data (after kickoff)
+        # Pregame polling is sparse (only 3 checkpoint polls)
+        if self.supabase.client and now >= game.kickoff_ts and not exchange_down:
+            try:
+                yes_ask, no_ask = self._get_asks(game.market_ticker)
+                favorite_price = max(yes_ask, no_ask) / 100.0 if max(yes_ask, no_ask) > 0 else None
+
+                if favorite_price:
+                    self._db_submit(
+                        'log_price_tick',
+                        market_ticker=game.market_ticker,
+                        timestamp=now,
+                        favorite_price=favorite_price,
+                        yes_ask=yes_ask,
+                        no_ask=no_ask
+                    )
+            except Exception as e:
+                logger.debug("Error logging tick for %s: %s", game.market_ticker, e)
+
+        # Retry exit orders that failed to place when their fill was detected
+        if game.positions and not game.exiting:
+            for position in game.positions:
+                if position.exit_order_id is None and position.size > 0:
+                    logger.info("[%s] Retrying exit order for %s contracts @ %s¢", game.market_ticker, position.size, position.entry_price)
+                    self._place_exit_order(game, position)
+
+        # Check if any pending orders have filled
+        if game.triggered and game.order_ids:
+            logger.info("→ Monitoring orders for %s", game.market_ticker)
+            self.check_order_fills(game)
+
+        # Monitor exit orders if we're in exit process
+        if game.exiting:
+            if self.monitor_exit_orders(game):
+                # All exit orders filled - position is flat
+                # Cancel any remaining buy orders before removing game
+                if game.order_ids:
+                    logger.info("Position flat for %s - cancelling %s remaining buy orders", game.market_title, len(game.order_ids))
+                    self.cancel_pending_orders(game)
+                return True
+            if not game.exit_order_ids:
+                # Halftime selling is disabled, so after the halftime cancels the game only stays
+                # for 55¢ exit sells whose cancel failed (retried here) and second-half tick
+                # logging; either way it is dropped once the game is over
+                if not exchange_down:
+                    self._cancel_exit_orders(game)
+                working_exits = [p.exit_order_id for p in game.positions if p.exit_order_id]
+                if now >= game.kickoff_ts + GAME_END_OFFSET_SECS:
+                    if working_exits:
+                        logger.warning("[%s] Game over with exit order(s) still uncancelled: %s", game.market_ticker, working_exits)
+                    logger.info("[%s] Game over, no longer monitoring", game.market_ticker)
+                    return True
+                if not working_exits and not self.supabase.client:
+                    logger.info("[%s] Halftime handled, no longer monitoring", game.market_ticker)
+                    return True
+            return False  # Skip other checks while exiting
+
+        if not game.triggered and not exchange_down and self.check_entry_signal(game, now):
+            # Entries are serialized so the concurrent-game limit and exposure stay consistent
+            with self._state_lock:
+                active_positions = self._games_with_positions
+                max_concurrent = self._max_concurrent_games
+
+                if active_positions < max_concurrent:
+                    self.enter_position(game)
+                else:
+                    logger.warning("Max concurrent games (%s) reached, skipping entry", max_concurrent)
+
+        return False
+
+    def _check_position_count(self):
+        """Debug aid: warn if the open-position counter has drifted from active_games."""
+        actual = sum(1 for g in self.active_games.values() if g.positions)
+        if actual != self._games_with_positions:
+            logger.warning(
+                "Open-position count drift: counter=%s, actual=%s; resyncing",
+                self._games_with_positions, actual,
+            )
+            self._games_with_positions = actual
+
+    def _remove_game(self, market_ticker: str):
+        """Stop monitoring a game for good."""
+        if self.active_games.pop(market_ticker).positions:
+            self._games_with_positions -= 1
+        self._dropped_tickers.add(market_ticker)
+        self._market_cache.pop(market_ticker, None)
+        if self.market_ws:
+            self.market_ws.forget(market_ticker)
+
+    def _next_wake(self, now: int) -> int:
+        """Earliest unix time at which the main loop has work to do."""
+        wake_at = min(self._next_discovery, self._next_status_log)
+        if self._halftime_heap:
+            wake_at = min(wake_at, self._halftime_heap[0][0])
+
+        for game in self.active_games.values():
+            # With orders/positions in play, or an eligible game still waiting to enter, poll every tick
+            if game.triggered or game.exiting or (game.is_eligible and now < game.kickoff_ts):
+                return now
+            if game.odds_30m is not None:
+                # Checkpoints done and no entry coming (vetoed games are kept for tick
+                # logging): only in-game price ticks remain; halftime comes off the heap
+                if self.supabase.client:
+                    if now >= game.kickoff_ts:
+                        return now
+                    wake_at = min(wake_at, game.kickoff_ts)
+                continue
+            next_checkpoint = next(
+                game.kickoff_ts - window
+                for odds_attr, _, _, window in self.CHECKPOINTS
+                if getattr(game, odds_attr) is None
+            )
+            if next_checkpoint <= now:
+                return now
+            wake_at = min(wake_at, next_checkpoint)
+
+        return wake_at
+
     def run(self):
         """Main trading loop."""
         logger.info("Starting trading bot...")
@@ -1101,122 +1661,88 @@ class LiveTrader:
 
         try:
             while True:
-                now = int(datetime.utcnow().timestamp())
+                tick_start = time.time()
+                now = int(tick_start)  # Single timestamp shared by the whole tick
 
-                if len(self.active_games) == 0 or now % 60 == 0:  # Rediscover every minute
-                    upcoming_games = self.discover_upcoming_games()
+                if now >= self._next_discovery:  # Rediscover every minute
+                    self._next_discovery = now + DISCOVERY_INTERVAL_SECS
+                    upcoming_games = self.discover_upcoming_games(now)
+                    self._prefetch_asks([game.market_ticker for game in upcoming_games])
 
                     for game in upcoming_games:
                         if game.market_ticker not in self.active_games:
                             self.active_games[game.market_ticker] = game
-                            kickoff_dt = datetime.fromtimestamp(game.kickoff_ts)
-                            logger.info(f"Monitoring: {game.market_title} @ {kickoff_dt.strftime('%Y-%m-%d %H:%M UTC')}")
+                            heapq.heappush(self._halftime_heap, (game.halftime_ts, game.market_ticker))
+                            if self.market_ws:
+                                self.market_ws.subscribe(game.market_ticker)
+                            kickoff_utc = time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(game.kickoff_ts))
+                            logger.info(f"Monitoring: {game.market_title} @ {kickoff_utc}")
 
                             # Fetch current odds for dashboard
-                            current_price = self.get_current_price(game.market_ticker)
-                            if current_price:
-                                game.pregame_prob = current_price
-                                logger.info(f"  Current odds: {current_price:.0%}")
+                            current_price_cents = self.get_current_price(game.market_ticker)
+                            if current_price_cents:
+                                game.pregame_prob = current_price_cents
+                                logger.info(f"  Current odds: {current_price_cents}¢")
 
                             # Log game to dashboard
-                            if self.supabase.client:
-                                self.supabase.log_game({
-                                    'market_ticker': game.market_ticker,
-                                    'event_ticker': game.event_ticker,
-                                    'market_title': game.market_title,
-                                    'yes_subtitle': game.yes_subtitle,
-                                    'kickoff_ts': game.kickoff_ts,
-                                    'halftime_ts': game.halftime_ts,
-                                    'pregame_prob': game.pregame_prob,
-                                    'status': 'monitoring'
-                                })
+                            self._db_submit('log_game', {
+                                'market_ticker': game.market_ticker,
+                                'event_ticker': game.event_ticker,
+                                'market_title': game.market_title,
+                                'yes_subtitle': game.yes_subtitle,
+                                'kickoff_ts': game.kickoff_ts,
+                                'halftime_ts': game.halftime_ts,
+                                'pregame_prob': cents_to_prob(game.pregame_prob),
+                                'status': 'monitoring'
+                            })
 
                 games_to_remove = []
 
-                for market_ticker, game in list(self.active_games.items()):
-                    # Log game status periodically (every minute)
-                    if now % 60 == 0:
-                        pending_count = len(game.order_ids) if game.order_ids else 0
-                        position_count = len(game.positions) if game.positions else 0
-                        logger.info(f"[{game.market_ticker}] Status: triggered={game.triggered}, pending_orders={pending_count}, positions={position_count}")
-
-                    # Check for halftime timeout - ONLY CANCEL ORDERS, NO SELLING
-                    # Manual selling will be done if needed
-                    total_position_size = sum(p.size for p in game.positions) if game.positions else 0
-                    if now >= game.halftime_ts and not game.exiting:
-                        logger.info("=" * 80)
-                        logger.info(f"HALFTIME TIMEOUT: {game.market_title} (Position size: {total_position_size} contracts)")
-                        logger.info(f"CANCELLING ORDERS ONLY - Manual exit required if position open")
-                        logger.info("=" * 80)
-
-                        # Cancel ALL orders (buy and exit)
-                        if game.order_ids:
-                            self.cancel_pending_orders(game)
-                        self._cancel_exit_orders(game)
-
-                        # DISABLED: Automatic halftime selling (causing issues with stale position data)
-                        # Will manually exit positions if needed
-                        # self.exit_position_at_halftime(game)
-
-                        # Mark as exiting to prevent re-triggering
-                        game.exiting = True
-                        continue
-
-                    # Check and capture checkpoints (6h, 3h, 30m before kickoff)
-                    self.check_and_capture_checkpoint(game, now)
-
-                    # Log price tick ONLY for in-game data (after kickoff)
-                    # Pregame polling is sparse (only 3 checkpoint polls)
-                    if self.supabase.client and now >= game.kickoff_ts:
-                        try:
-                            market = self.public_client.get_market(game.market_ticker)
-                            if market:
-                                yes_ask = market.yes_ask if market.yes_ask is not None else 0
-                                no_ask = market.no_ask if market.no_ask is not None else 0
-                                favorite_price = max(yes_ask, no_ask) / 100.0 if max(yes_ask, no_ask) > 0 else None
-
-                                if favorite_price:
-                                    self.supabase.log_price_tick(
-                                        market_ticker=game.market_ticker,
-                                        timestamp=now,
-                                        favorite_price=favorite_price,
-                                        yes_ask=yes_ask,
-                                        no_ask=no_ask
-                                    )
-                        except Exception as e:
-                            logger.debug(f"Error logging tick for {game.market_ticker}: {e}")
-
-                    # Check if any pending orders have filled
-                    if game.triggered and game.order_ids:
-                        logger.info(f"→ Monitoring orders for {game.market_ticker}")
-                        self.check_order_fills(game)
-
-
-                    # Monitor exit orders if we're in exit process
-                    if game.exiting:
-                        if self.monitor_exit_orders(game):
-                            # All exit orders filled - position is flat
-                            # Cancel any remaining buy orders before removing game
-                            if game.order_ids:
-                                logger.info(f"Position flat for {game.market_title} - cancelling {len(game.order_ids)} remaining buy orders")
-                                self.cancel_pending_orders(game)
-                            games_to_remove.append(market_ticker)
-                        continue  # Skip other checks while exiting
-
-                    if not game.triggered and self.check_entry_signal(game):
-                        active_positions = sum(1 for g in self.active_games.values() if g.positions)
-                        max_concurrent = self.config['risk']['max_concurrent_games']
-
-                        if active_positions < max_concurrent:
-                            self.enter_position(game)
-                        else:
-                            logger.warning(f"Max concurrent games ({max_concurrent}) reached, skipping entry")
-
+                # While the exchange breaker is open, skip telemetry and new entries;
+                # halftime cancels and exit sells still go out (they bypass the breaker)
+                exchange_down = self._exchange_cb.state == CircuitBreaker.OPEN
+
+                log_status = now >= self._next_status_log
+                if log_status:
+                    self._next_status_log = now + STATUS_LOG_INTERVAL_SECS
+                    if logger.isEnabledFor(logging.DEBUG):
+                        self._check_position_count()
+
+                # Halftime timeouts come off a heap keyed by halftime_ts, so the per-game
+                # work never has to test every game against the clock
+                halftime_games = []
+                while self._halftime_heap and self._halftime_heap[0][0] <= now:
+                    _, market_ticker = heapq.heappop(self._halftime_heap)
+                    game = self.active_games.get(market_ticker)
+                    if game and not game.exiting:
+                        halftime_games.append(game)
+                if halftime_games:
+                    self._handle_halftime(halftime_games)
+
+                # One batched quote fetch for every game that will read a price this tick
+                if not exchange_down:
+                    self._prefetch_asks([
+                        market_ticker for market_ticker, game in self.active_games.items()
+                        if self._needs_quote(game, now)
+                    ])
+
+                # Fan per-game work out so one slow game doesn't delay the others' checks
+                futures = {
+                    market_ticker: self._game_executor.submit(self._tick_game, game, now, log_status, exchange_down)
+                    for market_ticker, game in self.active_games.items()
+                }
+                for market_ticker, future in futures.items():
+                    if future.result():
+                        games_to_remove.append(market_ticker)
 
                 for market_ticker in games_to_remove:
-                    del self.active_games[market_ticker]
+                    self._remove_game(market_ticker)
 
-                time.sleep(self.config['monitoring']['poll_interval'])
+                # Sleep until something is due: every poll_interval while any game is live,
+                # otherwise until the next checkpoint, halftime, discovery or status deadline.
+                # The tick's own I/O time comes out of the wait.
+                wake_at = max(self._next_wake(now), tick_start + self._poll_interval)
+                time.sleep(max(0.0, wake_at - time.time()))
 
         except KeyboardInterrupt:
             logger.info("")
@@ -1226,6 +1752,12 @@ class LiveTrader:
             logger.info(f"Final bankroll: ${self.bankroll:,.2f}")
 
         finally:
+            self._stop_event.set()
+            self._game_executor.shutdown(wait=True)
+            self._db_flush()
+            self._state_db.close()
+            if self.market_ws:
+                self.market_ws.close()
             if self.trading_client:
                 self.trading_client.close()
             self.public_client.close()
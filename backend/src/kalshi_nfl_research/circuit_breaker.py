@@ -0,0 +1,135 @@
+"""
+Circuit breaker for exchange API calls.
+
+Stops the trading loop from hammering Kalshi every poll while the API is
+flapping: after enough consecutive failures the breaker opens and calls fail
+fast locally until a cool-down has passed, then a single trial call decides
+whether to close again.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the exchange while the breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    States:
+    - CLOSED: calls pass through; failures are counted
+    - OPEN: calls raise CircuitOpenError without touching the network
+    - HALF_OPEN: cool-down elapsed; exactly one trial call is let through,
+      closing the breaker on success or re-opening it on failure (other
+      callers fail fast while it is in flight)
+
+    Safe to share between threads.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "exchange",
+        fail_threshold: int = 5,
+        open_secs: float = 30.0,
+        slow_call_secs: float = 30.0,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Label used in log messages.
+            fail_threshold: Consecutive failures before the breaker opens.
+            open_secs: Seconds to fail fast before allowing a trial call.
+            slow_call_secs: Calls slower than this count as failures.
+        """
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.open_secs = open_secs
+        self.slow_call_secs = slow_call_secs
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving OPEN to HALF_OPEN once the cool-down has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """state without taking the lock (caller holds it)."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_secs:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def _admit(self, fn: Callable[..., Any]) -> None:
+        """Let a call through, or raise CircuitOpenError (claims the trial slot when HALF_OPEN)."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError(f"{self.name} circuit open, skipping {getattr(fn, '__name__', 'call')}")
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Invoke fn through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open.
+            Exception: Whatever fn raises (after recording the failure).
+        """
+        self._admit(fn)
+
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+
+        if time.monotonic() - start > self.slow_call_secs:
+            self.record_failure()
+        else:
+            self.record_success()
+        return result
+
+    def record_success(self) -> None:
+        """Reset the failure count and close the breaker."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"{self.name} circuit closed")
+            self.failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker at the threshold or on a failed trial."""
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.fail_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"{self.name} circuit open after {self.failures} consecutive failures; "
+                        f"pausing calls for {self.open_secs:.0f}s"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
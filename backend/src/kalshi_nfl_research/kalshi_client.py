@@ -6,11 +6,14 @@ All endpoints are public and require no authentication.
 
 import logging
 import os
+import threading
 import time
 from typing import Any, Iterator, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .data_models import Candle, MarketInfo, OrderbookSnapshot, SeriesInfo, Trade
 
@@ -24,8 +27,10 @@ class KalshiClient:
     Features:
     - Configurable base URL via environment variable or constructor
     - Automatic pagination with cursor
-    - Polite rate limiting
+    - Polite rate limiting (thread-safe request spacing)
     - Typed response models
+    - Pooled keep-alive connections (one TLS handshake per pooled socket)
+    - Transient failures (connection errors, 429/5xx) retried with exponential backoff
     """
 
     def __init__(
@@ -33,6 +38,10 @@ class KalshiClient:
         base_url: Optional[str] = None,
         rate_limit_sleep_ms: int = 200,
         timeout: int = 30,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16,
+        max_retries: int = 2,
+        backoff_factor: float = 0.1,
     ):
         """
         Initialize Kalshi API client.
@@ -41,6 +50,10 @@ class KalshiClient:
             base_url: API base URL. Defaults to KALSHI_BASE env var or fallback.
             rate_limit_sleep_ms: Milliseconds to sleep between requests.
             timeout: Request timeout in seconds.
+            pool_connections: Number of host connection pools to cache.
+            pool_maxsize: Max keep-alive connections kept per host.
+            max_retries: Retries per request for transient failures (0 disables).
+            backoff_factor: Base delay for exponential backoff between retries, in seconds.
         """
         self.base_url = (
             base_url
@@ -48,8 +61,21 @@ class KalshiClient:
         ).rstrip("/")
         self.rate_limit_sleep_ms = rate_limit_sleep_ms
         self.timeout = timeout
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0  # monotonic time the next request may start
         self.session = requests.Session()
         self.session.headers.update({"Accept": "application/json"})
+        # Every request is a GET, so retrying is safe; 429s honour Retry-After
+        retries = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logger.info(f"Initialized KalshiClient with base_url={self.base_url}")
 
     def _get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
@@ -69,7 +95,12 @@ class KalshiClient:
         url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
         logger.debug(f"GET {url} with params={params}")
 
-        time.sleep(self.rate_limit_sleep_ms / 1000.0)
+        # Space requests at least rate_limit_sleep_ms apart, across all threads sharing this client
+        with self._rate_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_at = time.monotonic() + self.rate_limit_sleep_ms / 1000.0
 
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
@@ -217,6 +248,33 @@ class KalshiClient:
         )
         return markets
 
+    def get_markets_by_ticker(self, tickers: list[str], chunk_size: int = 100) -> list[MarketInfo]:
+        """
+        Fetch several markets by ticker, one request per chunk of tickers.
+
+        Args:
+            tickers: Market tickers.
+            chunk_size: Tickers per request.
+
+        Returns:
+            List of MarketInfo objects (tickers that don't exist are omitted).
+
+        Raises:
+            requests.RequestException: On request failure.
+        """
+        markets = []
+        for start in range(0, len(tickers), chunk_size):
+            chunk = tickers[start:start + chunk_size]
+            params = {"tickers": ",".join(chunk), "limit": len(chunk)}
+            for item in self._paginate("/markets", params=params, data_key="markets"):
+                try:
+                    markets.append(MarketInfo(**item))
+                except Exception as e:
+                    logger.warning(f"Failed to parse market {item.get('ticker')}: {e}")
+
+        logger.debug(f"Fetched {len(markets)} of {len(tickers)} requested markets")
+        return markets
+
     def get_market(self, ticker: str) -> Optional[MarketInfo]:
         """
         Fetch a single market by ticker.
@@ -386,6 +444,24 @@ class KalshiClient:
             )
             return []
 
+    # -------------------------------------------------------------------------
+    # Connection Keep-Alive
+    # -------------------------------------------------------------------------
+
+    def ping(self) -> bool:
+        """
+        Hit the lightweight exchange status endpoint to keep pooled connections warm.
+
+        Returns:
+            True if the request succeeded.
+        """
+        try:
+            self._get("/exchange/status")
+            return True
+        except Exception as e:
+            logger.debug(f"Keep-alive ping failed: {e}")
+            return False
+
     def close(self) -> None:
         """Close the underlying session."""
         self.session.close()
@@ -0,0 +1,216 @@
+"""
+Kalshi WebSocket market-data feed.
+
+Subscribes to the ``ticker`` channel for the markets the bot is watching and
+keeps the latest best asks in memory, so the trading loop can read quotes
+without issuing an HTTP request per game per tick.
+"""
+
+import base64
+import collections
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from websockets.sync.client import connect
+
+logger = logging.getLogger(__name__)
+
+WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
+WS_SIGN_PATH = "/trade-api/ws/v2"
+
+
+class KalshiMarketWs:
+    """
+    Background WebSocket client for Kalshi ticker updates.
+
+    Features:
+    - Authenticated connection (same RSA-PSS key signing as the REST SDK)
+    - Subscriptions replayed automatically after a reconnect
+    - Quotes are only served while connected and fresh; callers fall back to REST otherwise
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        url: str = WS_URL,
+        reconnect_secs: float = 5.0,
+        max_quote_age_secs: Optional[float] = None,
+    ):
+        """
+        Initialize and start the feed thread.
+
+        Args:
+            api_key: Kalshi API key id.
+            api_secret: PEM-encoded RSA private key.
+            url: WebSocket endpoint.
+            reconnect_secs: Delay before reconnecting after a dropped connection.
+            max_quote_age_secs: Quotes not updated for longer than this are not
+                served (None = no limit).
+        """
+        if '\\n' in api_secret:
+            api_secret = api_secret.replace('\\n', '\n')
+        self.api_key = api_key
+        self.private_key = serialization.load_pem_private_key(api_secret.encode(), password=None)
+        self.url = url
+        self.reconnect_secs = reconnect_secs
+        self.max_quote_age_secs = max_quote_age_secs
+
+        self._tickers: set[str] = set()  # Everything we want subscribed
+        self._pending: set[str] = set()  # Not yet sent on the current connection
+        self._unsubscribe: set[str] = set()  # Forgotten, still subscribed on the current connection
+        self._sids: dict[str, int] = {}  # ticker -> subscription id on the current connection
+        self._inflight: dict[int, list[str]] = {}  # subscribe msg id -> tickers awaiting confirmation
+        # ticker -> (yes_ask, no_ask) cents, monotonic receive time
+        self._quotes: dict[str, tuple[tuple[int, int], float]] = {}
+        self._lock = threading.Lock()
+        self._connected = False
+        self._msg_id = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="market-ws", daemon=True)
+        self._thread.start()
+
+    def subscribe(self, market_ticker: str) -> None:
+        """Start streaming ticker updates for a market."""
+        with self._lock:
+            if market_ticker not in self._tickers:
+                self._tickers.add(market_ticker)
+                self._pending.add(market_ticker)
+
+    def forget(self, market_ticker: str) -> None:
+        """Stop tracking a market and unsubscribe it (it is not resubscribed after reconnects)."""
+        with self._lock:
+            self._tickers.discard(market_ticker)
+            self._pending.discard(market_ticker)
+            self._quotes.pop(market_ticker, None)
+            if market_ticker in self._sids:
+                self._unsubscribe.add(market_ticker)
+
+    def get_quote(self, market_ticker: str) -> Optional[tuple[int, int]]:
+        """
+        Latest streamed quote for a market.
+
+        Returns:
+            (yes_ask, no_ask) in cents, or None if not connected, no update seen
+            yet, or the last update is older than max_quote_age_secs.
+        """
+        if not self._connected:
+            return None
+        entry = self._quotes.get(market_ticker)
+        if entry is None:
+            return None
+        quote, received_at = entry
+        if self.max_quote_age_secs is not None and time.monotonic() - received_at > self.max_quote_age_secs:
+            return None
+        return quote
+
+    def close(self) -> None:
+        """Stop the feed thread."""
+        self._stop_event.set()
+        self._thread.join(timeout=self.reconnect_secs + 2)
+
+    # -------------------------------------------------------------------------
+    # Feed thread
+    # -------------------------------------------------------------------------
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Signed handshake headers: timestamp + GET + path, RSA-PSS/SHA256."""
+        timestamp_str = str(int(time.time() * 1000))
+        signature = self.private_key.sign(
+            f"{timestamp_str}GET{WS_SIGN_PATH}".encode(),
+            padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
+            hashes.SHA256(),
+        )
+        return {
+            "KALSHI-ACCESS-KEY": self.api_key,
+            "KALSHI-ACCESS-SIGNATURE": base64.b64encode(signature).decode("utf-8"),
+            "KALSHI-ACCESS-TIMESTAMP": timestamp_str,
+        }
+
+    def _run(self) -> None:
+        """Connect, stream, and reconnect until closed."""
+        while not self._stop_event.is_set():
+            try:
+                with connect(self.url, additional_headers=self._auth_headers()) as ws:
+                    logger.info(f"Market WebSocket connected: {self.url}")
+                    with self._lock:
+                        self._pending = set(self._tickers)
+                        self._unsubscribe.clear()
+                        self._sids.clear()
+                        self._inflight.clear()
+                    self._connected = True
+                    self._stream(ws)
+            except Exception as e:
+                logger.warning(f"Market WebSocket error: {e}")
+            finally:
+                self._connected = False
+                self._quotes.clear()
+            self._stop_event.wait(self.reconnect_secs)
+
+    def _stream(self, ws) -> None:
+        """Send queued subscriptions and apply ticker messages."""
+        while not self._stop_event.is_set():
+            with self._lock:
+                pending, self._pending = sorted(self._pending), set()
+                unsubscribe = collections.defaultdict(list)  # sid -> tickers
+                for market_ticker in sorted(self._unsubscribe):
+                    unsubscribe[self._sids.pop(market_ticker)].append(market_ticker)
+                self._unsubscribe.clear()
+                if pending:
+                    self._msg_id += 1
+                    self._inflight[self._msg_id] = pending
+                    subscribe_id = self._msg_id
+
+            if pending:
+                ws.send(json.dumps({
+                    "id": subscribe_id,
+                    "cmd": "subscribe",
+                    "params": {"channels": ["ticker"], "market_tickers": pending},
+                }))
+            for sid, market_tickers in unsubscribe.items():
+                self._msg_id += 1
+                ws.send(json.dumps({
+                    "id": self._msg_id,
+                    "cmd": "update_subscription",
+                    "params": {"sids": [sid], "market_tickers": market_tickers, "action": "delete_markets"},
+                }))
+
+            try:
+                raw = ws.recv(timeout=1.0)
+            except TimeoutError:
+                continue
+
+            data = json.loads(raw)
+            if data.get("type") == "ticker":
+                self._apply_ticker(data.get("msg", {}))
+            elif data.get("type") == "subscribed":
+                self._apply_subscribed(data.get("id"), data.get("msg", {}))
+            elif data.get("type") == "error":
+                logger.error(f"Market WebSocket error message: {data.get('msg')}")
+
+    def _apply_ticker(self, msg: dict) -> None:
+        """Store best asks from a ticker update (no ask = 100 - yes bid)."""
+        market_ticker = msg.get("market_ticker")
+        if market_ticker not in self._tickers:
+            return
+        yes_ask = msg.get("yes_ask") or 0
+        yes_bid = msg.get("yes_bid") or 0
+        no_ask = 100 - yes_bid if yes_bid else 0
+        self._quotes[market_ticker] = ((yes_ask, no_ask), time.monotonic())
+
+    def _apply_subscribed(self, msg_id: Optional[int], msg: dict) -> None:
+        """Record the subscription id for a confirmed subscribe (needed to unsubscribe later)."""
+        with self._lock:
+            market_tickers = self._inflight.pop(msg_id, [])
+            sid = msg.get("sid")
+            if sid is None:
+                return
+            for market_ticker in market_tickers:
+                self._sids[market_ticker] = sid
+                if market_ticker not in self._tickers:  # Forgotten while the subscribe was in flight
+                    self._unsubscribe.add(market_ticker)
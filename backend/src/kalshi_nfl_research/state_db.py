@@ -0,0 +1,127 @@
+"""
+Local per-game state store for the live trader.
+
+Keeps each monitored game's checkpoints, eligibility and open orders/positions
+in a small SQLite file so a restart resumes where it left off instead of
+re-triggering games or losing track of orders already on the exchange.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any
+
+# Bump when the game_monitors schema changes; older tables are dropped
+STATE_DB_VERSION = 4
+
+GAME_STATE_COLUMNS = (
+    'market_ticker', 'event_ticker', 'market_title', 'yes_subtitle', 'kickoff_ts', 'halftime_ts',
+    'pregame_prob', 'odds_6h', 'odds_3h', 'odds_30m',
+    'checkpoint_6h_ts', 'checkpoint_3h_ts', 'checkpoint_30m_ts',
+    'is_eligible', 'position_side', 'triggered',
+    'order_ids', 'positions',
+)
+
+# Columns holding lists, stored as JSON text
+JSON_COLUMNS = frozenset({'order_ids', 'positions'})
+
+_UPSERT = (
+    f"INSERT INTO game_monitors (dry_run, {', '.join(GAME_STATE_COLUMNS)}) "
+    f"VALUES (?, {', '.join('?' * len(GAME_STATE_COLUMNS))}) "
+    f"ON CONFLICT(market_ticker, dry_run) DO UPDATE SET "
+    + ', '.join(f"{col} = excluded.{col}" for col in GAME_STATE_COLUMNS[1:])
+)
+
+
+class GameStateDB:
+    """
+    SQLite-backed store of per-game state, keyed by market_ticker.
+
+    Rows are tagged with the trading mode that wrote them and each instance only
+    reads and writes its own mode, so a dry run's fake order IDs never reach a
+    live session (nor live orders and positions a dry run).
+
+    Opened in autocommit + WAL mode so each save is durable on its own.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str, dry_run: bool = False):
+        self.dry_run = dry_run
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        if self._db.execute('PRAGMA user_version').fetchone()[0] != STATE_DB_VERSION:
+            self._db.execute('DROP TABLE IF EXISTS game_monitors')
+            self._db.execute(f'PRAGMA user_version = {STATE_DB_VERSION}')
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS game_monitors (
+                market_ticker TEXT NOT NULL,
+                dry_run INTEGER NOT NULL,
+                event_ticker TEXT,
+                market_title TEXT,
+                yes_subtitle TEXT,
+                kickoff_ts INTEGER NOT NULL,
+                halftime_ts INTEGER NOT NULL,
+                pregame_prob INTEGER,
+                odds_6h INTEGER,
+                odds_3h INTEGER,
+                odds_30m INTEGER,
+                checkpoint_6h_ts INTEGER,
+                checkpoint_3h_ts INTEGER,
+                checkpoint_30m_ts INTEGER,
+                is_eligible INTEGER,
+                position_side TEXT,
+                triggered INTEGER NOT NULL DEFAULT 0,
+                order_ids TEXT NOT NULL DEFAULT '[]',
+                positions TEXT NOT NULL DEFAULT '[]',
+                PRIMARY KEY (market_ticker, dry_run)
+            )
+        """)
+
+    def save(self, state: dict[str, Any]) -> None:
+        """
+        Upsert one game's state under this instance's mode.
+
+        Args:
+            state: Value for every column in GAME_STATE_COLUMNS; order_ids is a
+                list of order IDs and positions a list of JSON-serialisable dicts
+        """
+        row = (int(self.dry_run),) + tuple(
+            json.dumps(state[col]) if col in JSON_COLUMNS else state[col]
+            for col in GAME_STATE_COLUMNS
+        )
+        with self._lock:
+            self._db.execute(_UPSERT, row)
+
+    def load(self, now: int) -> list[dict[str, Any]]:
+        """
+        Return the saved state of every game in this mode that hasn't reached halftime yet.
+
+        Games already past halftime are deleted (in either mode); there is nothing
+        left to resume. Rows written in the other mode are left untouched.
+        is_eligible and triggered come back as bools (is_eligible may be None).
+        """
+        with self._lock:
+            self._db.execute('DELETE FROM game_monitors WHERE halftime_ts <= ?', (now,))
+            rows = self._db.execute(
+                f"SELECT {', '.join(GAME_STATE_COLUMNS)} FROM game_monitors "
+                "WHERE halftime_ts > ? AND dry_run = ?",
+                (now, int(self.dry_run)),
+            ).fetchall()
+
+        states = []
+        for row in rows:
+            state = dict(zip(GAME_STATE_COLUMNS, row))
+            for col in JSON_COLUMNS:
+                state[col] = json.loads(state[col])
+            if state['is_eligible'] is not None:
+                state['is_eligible'] = bool(state['is_eligible'])
+            state['triggered'] = bool(state['triggered'])
+            states.append(state)
+        return states
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._db.close()
@@ -7,12 +7,15 @@ import uuid
 from typing import Optional, Literal
 from dataclasses import dataclass
 
-from kalshi_python import Configuration, KalshiClient as OfficialKalshiClient, PortfolioApi
+from kalshi_python import Configuration, ExchangeApi, KalshiClient as OfficialKalshiClient, PortfolioApi
 
 logger = logging.getLogger(__name__)
 
+# Kalshi accepts at most this many orders per batch request
+MAX_BATCH_SIZE = 20
 
-@dataclass
+
+@dataclass(slots=True)
 class Order:
     """Represents a Kalshi order."""
     order_id: str
@@ -28,6 +31,11 @@ class KalshiTradingClient:
     """
     Client for Kalshi Trading API.
     Handles authentication and order placement using the official kalshi-python library.
+
+    Order entry is REST-only: Kalshi's WebSocket API carries market data and fill
+    notifications but does not accept order or cancel messages. Requests go through
+    the SDK's urllib3 PoolManager, so connections stay open between calls; use the
+    *_batch methods to collapse multi-order actions into one round trip.
     """
 
     def __init__(
@@ -50,6 +58,7 @@ class KalshiTradingClient:
             config.private_key_pem = api_secret
             self.client = OfficialKalshiClient(config)
             self.portfolio_api = PortfolioApi(self.client)
+            self.exchange_api = ExchangeApi(self.client)
             logger.info("Successfully authenticated with API key")
         elif email and password:
             # Official client doesn't support email/password, fall back to basic auth
@@ -129,12 +138,114 @@ class KalshiTradingClient:
         logger.info(f"Order placed successfully: {order.order_id}")
         return order
 
+    def place_orders_batch(self, orders: list[dict]) -> list[tuple[Optional[Order], Optional[str]]]:
+        """
+        Place several limit/market orders using Kalshi's batch create endpoint.
+
+        Args:
+            orders: Dicts with place_order's keyword arguments
+                (market_ticker, side, action, count, price, optional order_type)
+
+        Falls back to one place_order call per order if a batch request fails.
+
+        Returns:
+            List aligned with `orders` of (Order, None) on success or (None, error message)
+        """
+        results: list[tuple[Optional[Order], Optional[str]]] = []
+
+        for start in range(0, len(orders), MAX_BATCH_SIZE):
+            chunk = orders[start:start + MAX_BATCH_SIZE]
+            requests = [
+                {
+                    "ticker": o["market_ticker"],
+                    "client_order_id": f"order_{int(time.time())}_{str(uuid.uuid4())[:8]}",
+                    "side": o["side"],
+                    "action": o["action"],
+                    "count": o["count"],
+                    "type": o.get("order_type", "limit"),
+                    "yes_price": o["price"] if o["side"] == "yes" else None,
+                    "no_price": o["price"] if o["side"] == "no" else None,
+                }
+                for o in chunk
+            ]
+            logger.info(f"Placing batch of {len(chunk)} order(s)")
+
+            try:
+                response = self.portfolio_api.batch_create_orders(orders=requests)
+            except Exception as e:
+                logger.warning(f"Batch create failed ({e}), placing {len(chunk)} order(s) individually")
+                for o in chunk:
+                    try:
+                        results.append((self.place_order(**o), None))
+                    except Exception as order_error:
+                        results.append((None, str(order_error)))
+                continue
+
+            items = response.responses or []
+            for o, item in zip(chunk, items):
+                if item.error or not item.order:
+                    results.append((None, str(item.error) if item.error else "no order returned"))
+                    continue
+                results.append((
+                    Order(
+                        order_id=item.order.order_id,
+                        market_ticker=o["market_ticker"],
+                        side=o["side"],
+                        action=o["action"],
+                        count=o["count"],
+                        price=o["price"],
+                        status=getattr(item.order, "status", None) or "pending",
+                    ),
+                    None,
+                ))
+            for _ in chunk[len(items):]:
+                results.append((None, "missing from batch response"))
+
+        return results
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order."""
         self.portfolio_api.cancel_order(order_id=order_id)
         logger.info(f"Order {order_id} cancelled")
         return True
 
+    def cancel_orders_batch(self, order_ids: list[str]) -> dict[str, Optional[str]]:
+        """
+        Cancel several orders using Kalshi's batch cancel endpoint.
+
+        Falls back to one cancel_order call per order if a batch request fails.
+
+        Returns:
+            Dict mapping each order_id to None (cancelled) or an error message
+        """
+        results: dict[str, Optional[str]] = {}
+
+        for start in range(0, len(order_ids), MAX_BATCH_SIZE):
+            chunk = list(order_ids[start:start + MAX_BATCH_SIZE])
+            try:
+                response = self.portfolio_api.batch_cancel_orders(order_ids=chunk)
+            except Exception as e:
+                logger.warning(f"Batch cancel failed ({e}), cancelling {len(chunk)} order(s) individually")
+                for order_id in chunk:
+                    try:
+                        self.cancel_order(order_id)
+                        results[order_id] = None
+                    except Exception as cancel_error:
+                        results[order_id] = str(cancel_error)
+                continue
+
+            # Responses come back in request order; prefer the echoed order_id when present
+            items = response.responses or []
+            for order_id, item in zip(chunk, items):
+                order_id = item.order_id or order_id
+                results[order_id] = str(item.error) if item.error else None
+            for order_id in chunk[len(items):]:
+                results[order_id] = "missing from batch response"
+
+        cancelled = sum(1 for error in results.values() if error is None)
+        logger.info(f"Batch cancel: {cancelled}/{len(order_ids)} order(s) cancelled")
+        return results
+
     def get_order_status(self, order_id: str) -> dict:
         """
         Get status of an order.
@@ -170,6 +281,15 @@ class KalshiTradingClient:
             logger.error(f"Error getting order status for {order_id}: {e}")
             raise
 
+    def ping(self) -> bool:
+        """Cheap exchange status call that keeps the SDK's pooled connection warm."""
+        try:
+            self.exchange_api.get_exchange_status()
+            return True
+        except Exception as e:
+            logger.debug(f"Keep-alive ping failed: {e}")
+            return False
+
     def close(self):
         """Close the client."""
         # Official client handles cleanup automatically
@@ -291,6 +291,41 @@ class SupabaseLogger:
         except Exception as e:
             logger.error(f"Error logging price tick: {e}")
 
+    def log_price_ticks(self, ticks: list):
+        """
+        Log several price ticks with one game lookup and one insert.
+
+        Args:
+            ticks: Dicts with log_price_tick's arguments (market_ticker, timestamp,
+                   favorite_price, and optionally yes_ask / no_ask)
+        """
+        if not self.client or not ticks:
+            return
+
+        try:
+            # Resolve every game_id in one query
+            tickers = list({tick['market_ticker'] for tick in ticks})
+            games = self.client.table('games').select('id, market_ticker').in_('market_ticker', tickers).execute()
+            game_ids = {game['market_ticker']: game['id'] for game in games.data or []}
+
+            rows = [
+                {
+                    'market_ticker': tick['market_ticker'],
+                    'game_id': game_ids.get(tick['market_ticker']),
+                    'timestamp': tick['timestamp'],
+                    'favorite_price': tick['favorite_price'],
+                    'yes_ask': tick.get('yes_ask'),
+                    'no_ask': tick.get('no_ask')
+                }
+                for tick in ticks
+            ]
+
+            self.client.table('market_ticks').insert(rows).execute()
+            logger.debug(f"Logged {len(rows)} price tick(s)")
+
+        except Exception as e:
+            logger.error(f"Error logging price ticks: {e}")
+
     def log_order(self, market_ticker: str, order_id: str, price: int, size: int, side: str = 'buy') -> Optional[str]:
         """
         Log a new order placement.
@@ -360,6 +395,28 @@ class SupabaseLogger:
         self.client.table('orders').update(update_data).eq('order_id', order_id).execute()
         logger.debug(f"Updated order {order_id}: {status} ({filled_size} filled)")
 
+    @retry_on_failure(max_retries=3, delay=1)
+    def update_orders_status(self, order_ids: list, status: str, filled_size: int = 0):
+        """
+        Update the status of several orders in one request (e.g. after a batch cancel).
+
+        Args:
+            order_ids: Kalshi order IDs
+            status: 'pending', 'filled', 'partially_filled', 'cancelled'
+            filled_size: Number of contracts filled (applied to every order)
+        """
+        if not self.client or not order_ids:
+            return
+
+        update_data = {
+            'status': status,
+            'filled_size': filled_size,
+            'updated_at': 'now()'
+        }
+
+        self.client.table('orders').update(update_data).in_('order_id', list(order_ids)).execute()
+        logger.debug(f"Updated {len(order_ids)} order(s): {status}")
+
     def get_pending_orders(self, market_ticker: str) -> list:
         """
         Get all pending orders for a market.
@@ -0,0 +1,173 @@
+"""
+Tests for the exchange circuit breaker.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from kalshi_nfl_research import circuit_breaker
+from kalshi_nfl_research.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Stands in for time.monotonic so cool-downs can be stepped through."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def fail():
+    raise RuntimeError("exchange down")
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.fail_threshold):
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+
+
+class TestCircuitBreaker:
+    """Test CLOSED -> OPEN -> HALF_OPEN -> CLOSED/OPEN transitions."""
+
+    def test_closed_passes_calls_through(self, clock):
+        """Test successful calls return their result and keep the breaker closed."""
+        breaker = CircuitBreaker(fail_threshold=3, open_secs=30)
+
+        assert breaker.call(lambda x: x * 2, 21) == 42
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test the breaker opens at the threshold and then fails fast."""
+        breaker = CircuitBreaker(fail_threshold=3, open_secs=30)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                breaker.call(fail)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        called = []
+        with pytest.raises(CircuitOpenError):
+            breaker.call(called.append, 1)
+        assert called == []
+
+    def test_success_resets_failure_count(self, clock):
+        """Test failures must be consecutive to open the breaker."""
+        breaker = CircuitBreaker(fail_threshold=2, open_secs=30)
+
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+        breaker.call(lambda: None)
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_after_cool_down(self, clock):
+        """Test the breaker moves to HALF_OPEN once open_secs have passed."""
+        breaker = CircuitBreaker(fail_threshold=1, open_secs=30)
+        open_breaker(breaker)
+
+        clock.now += 29
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_successful_trial_closes(self, clock):
+        """Test a successful HALF_OPEN trial closes the breaker."""
+        breaker = CircuitBreaker(fail_threshold=1, open_secs=30)
+        open_breaker(breaker)
+        clock.now += 30
+
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failures == 0
+
+    def test_failed_trial_reopens(self, clock):
+        """Test a failed HALF_OPEN trial re-opens the breaker for a fresh cool-down."""
+        breaker = CircuitBreaker(fail_threshold=5, open_secs=30)
+        open_breaker(breaker)
+        clock.now += 30
+
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now += 29
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_slow_call_counts_as_failure(self, clock):
+        """Test a call slower than slow_call_secs is recorded as a failure."""
+        breaker = CircuitBreaker(fail_threshold=1, open_secs=30, slow_call_secs=5)
+
+        def slow():
+            clock.now += 6
+            return "late"
+
+        assert breaker.call(slow) == "late"
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_allows_one_trial_at_a_time(self, clock):
+        """Test concurrent callers fail fast while the HALF_OPEN trial is in flight."""
+        breaker = CircuitBreaker(fail_threshold=1, open_secs=30)
+        open_breaker(breaker)
+        clock.now += 30
+
+        trial_started = threading.Event()
+        release_trial = threading.Event()
+
+        def trial():
+            trial_started.set()
+            release_trial.wait(5)
+            return "trial"
+
+        results = []
+        worker = threading.Thread(target=lambda: results.append(breaker.call(trial)))
+        worker.start()
+        assert trial_started.wait(5)
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "second")
+
+        release_trial.set()
+        worker.join(5)
+
+        assert results == ["trial"]
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.call(lambda: "after") == "after"
+
+    def test_concurrent_failures_are_all_counted(self, clock):
+        """Test the failure counter doesn't lose updates across threads."""
+        breaker = CircuitBreaker(fail_threshold=10_000, open_secs=30)
+
+        def record_many():
+            for _ in range(1000):
+                breaker.record_failure()
+
+        threads = [threading.Thread(target=record_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert breaker.failures == 8000
@@ -0,0 +1,226 @@
+"""
+Tests for the WebSocket market-data feed.
+"""
+
+import json
+import queue
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_nfl_research import market_ws
+from kalshi_nfl_research.market_ws import KalshiMarketWs
+
+
+class FakeWs:
+    """One fake connection: records sent commands, serves queued messages."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.inbox: queue.Queue = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def send(self, raw: str) -> None:
+        self.sent.append(json.loads(raw))
+
+    def recv(self, timeout: Optional[float] = None):
+        try:
+            item = self.inbox.get(timeout=0.01)
+        except queue.Empty:
+            raise TimeoutError
+        if isinstance(item, Exception):
+            raise item
+        return json.dumps(item)
+
+
+class FakeConnect:
+    """Stands in for websockets' connect(), handing out a new FakeWs per connection."""
+
+    def __init__(self):
+        self.connections: list[FakeWs] = []
+
+    def __call__(self, url, additional_headers=None):
+        ws = FakeWs()
+        self.connections.append(ws)
+        return ws
+
+
+def wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.005)
+    raise AssertionError("condition not met in time")
+
+
+@pytest.fixture
+def api_secret():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    fake = FakeConnect()
+    monkeypatch.setattr(market_ws, "connect", fake)
+    return fake
+
+
+@pytest.fixture
+def feed(api_secret, fake_connect):
+    ws = KalshiMarketWs(api_key="key-id", api_secret=api_secret, reconnect_secs=0.01)
+    wait_for(lambda: fake_connect.connections and ws._connected)
+    yield ws
+    ws.close()
+
+
+def sent_commands(ws: FakeWs, cmd: str) -> list[dict]:
+    return [msg for msg in ws.sent if msg["cmd"] == cmd]
+
+
+class TestApplyTicker:
+    """Test parsing of ticker channel messages."""
+
+    def test_no_ask_derived_from_yes_bid(self, feed):
+        """Test no_ask = 100 - yes_bid."""
+        feed.subscribe("MKT-A")
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": 62, "yes_bid": 58})
+
+        assert feed.get_quote("MKT-A") == (62, 42)
+
+    def test_missing_sides_become_zero(self, feed):
+        """Test a side with no quote is reported as 0."""
+        feed.subscribe("MKT-A")
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": None, "yes_bid": 0})
+
+        assert feed.get_quote("MKT-A") == (0, 0)
+
+    def test_unwatched_market_ignored(self, feed):
+        """Test updates for markets we aren't subscribed to are dropped."""
+        feed._apply_ticker({"market_ticker": "OTHER", "yes_ask": 50, "yes_bid": 49})
+
+        assert feed.get_quote("OTHER") is None
+
+    def test_stream_applies_ticker_messages(self, feed, fake_connect):
+        """Test ticker messages received on the socket update quotes."""
+        feed.subscribe("MKT-A")
+        fake_connect.connections[-1].inbox.put(
+            {"type": "ticker", "msg": {"market_ticker": "MKT-A", "yes_ask": 70, "yes_bid": 68}}
+        )
+
+        wait_for(lambda: feed.get_quote("MKT-A") == (70, 32))
+
+
+class TestQuoteStaleness:
+    """Test quotes past max_quote_age_secs are not served."""
+
+    def test_stale_quote_not_served(self, feed, monkeypatch):
+        """Test a quote older than the limit reads as missing."""
+        feed.max_quote_age_secs = 20
+        feed.subscribe("MKT-A")
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": 62, "yes_bid": 58})
+        received_at = time.monotonic()
+
+        monkeypatch.setattr(market_ws.time, "monotonic", lambda: received_at + 19)
+        assert feed.get_quote("MKT-A") == (62, 42)
+
+        monkeypatch.setattr(market_ws.time, "monotonic", lambda: received_at + 21)
+        assert feed.get_quote("MKT-A") is None
+
+    def test_no_limit_by_default(self, feed, monkeypatch):
+        """Test quotes never expire when no limit is configured."""
+        feed.subscribe("MKT-A")
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": 62, "yes_bid": 58})
+        received_at = time.monotonic()
+
+        monkeypatch.setattr(market_ws.time, "monotonic", lambda: received_at + 3600)
+        assert feed.get_quote("MKT-A") == (62, 42)
+
+
+class TestSubscriptions:
+    """Test subscribe, reconnect replay, and forget."""
+
+    def test_subscribe_sends_command(self, feed, fake_connect):
+        """Test a new market is subscribed on the ticker channel."""
+        feed.subscribe("MKT-A")
+        ws = fake_connect.connections[-1]
+
+        wait_for(lambda: sent_commands(ws, "subscribe"))
+        params = sent_commands(ws, "subscribe")[0]["params"]
+        assert params == {"channels": ["ticker"], "market_tickers": ["MKT-A"]}
+
+    def test_subscriptions_replayed_on_reconnect(self, feed, fake_connect):
+        """Test every watched market is resubscribed after the connection drops."""
+        feed.subscribe("MKT-A")
+        feed.subscribe("MKT-B")
+        first = fake_connect.connections[-1]
+        wait_for(lambda: sum(len(m["params"]["market_tickers"]) for m in sent_commands(first, "subscribe")) == 2)
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": 62, "yes_bid": 58})
+
+        first.inbox.put(ConnectionError("dropped"))
+        wait_for(lambda: len(fake_connect.connections) == 2 and sent_commands(fake_connect.connections[1], "subscribe"))
+
+        replay = sent_commands(fake_connect.connections[1], "subscribe")
+        assert replay[0]["params"]["market_tickers"] == ["MKT-A", "MKT-B"]
+        assert feed.get_quote("MKT-A") is None  # Quotes from the old connection are dropped
+
+    def test_forget_sends_unsubscribe(self, feed, fake_connect):
+        """Test forgetting a confirmed market removes it from its subscription."""
+        feed.subscribe("MKT-A")
+        ws = fake_connect.connections[-1]
+        wait_for(lambda: sent_commands(ws, "subscribe"))
+        msg_id = sent_commands(ws, "subscribe")[0]["id"]
+        ws.inbox.put({"type": "subscribed", "id": msg_id, "msg": {"channel": "ticker", "sid": 7}})
+        wait_for(lambda: "MKT-A" in feed._sids)
+        feed._apply_ticker({"market_ticker": "MKT-A", "yes_ask": 62, "yes_bid": 58})
+
+        feed.forget("MKT-A")
+
+        wait_for(lambda: sent_commands(ws, "update_subscription"))
+        params = sent_commands(ws, "update_subscription")[0]["params"]
+        assert params == {"sids": [7], "market_tickers": ["MKT-A"], "action": "delete_markets"}
+        assert feed.get_quote("MKT-A") is None
+
+    def test_forget_before_confirmation_unsubscribes_once_confirmed(self, feed, fake_connect):
+        """Test a market forgotten while its subscribe is in flight is removed on confirmation."""
+        feed.subscribe("MKT-A")
+        ws = fake_connect.connections[-1]
+        wait_for(lambda: sent_commands(ws, "subscribe"))
+        msg_id = sent_commands(ws, "subscribe")[0]["id"]
+
+        feed.forget("MKT-A")
+        ws.inbox.put({"type": "subscribed", "id": msg_id, "msg": {"channel": "ticker", "sid": 3}})
+
+        wait_for(lambda: sent_commands(ws, "update_subscription"))
+        assert sent_commands(ws, "update_subscription")[0]["params"]["sids"] == [3]
+
+    def test_forgotten_market_not_replayed(self, feed, fake_connect):
+        """Test a forgotten market is not resubscribed after a reconnect."""
+        feed.subscribe("MKT-A")
+        feed.subscribe("MKT-B")
+        first = fake_connect.connections[-1]
+        wait_for(lambda: sent_commands(first, "subscribe"))
+
+        feed.forget("MKT-A")
+        first.inbox.put(ConnectionError("dropped"))
+        wait_for(lambda: len(fake_connect.connections) == 2 and sent_commands(fake_connect.connections[1], "subscribe"))
+
+        replay = sent_commands(fake_connect.connections[1], "subscribe")
+        assert replay[0]["params"]["market_tickers"] == ["MKT-B"]
@@ -0,0 +1,110 @@
+"""
+Tests for batched market lookup by ticker.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from unittest.mock import patch
+
+import pytest
+
+from kalshi_nfl_research.kalshi_client import KalshiClient
+
+
+def market_item(ticker: str, yes_ask: int = 55) -> dict:
+    return {
+        "ticker": ticker,
+        "event_ticker": ticker.rsplit("-", 1)[0],
+        "market_type": "binary",
+        "title": f"Market {ticker}",
+        "yes_ask": yes_ask,
+        "no_ask": 100 - yes_ask + 2,
+    }
+
+
+class FakePaginate:
+    """Stands in for KalshiClient._paginate, serving only the markets that exist."""
+
+    def __init__(self, existing: set[str]):
+        self.existing = existing
+        self.calls: list[dict] = []
+
+    def __call__(self, endpoint, params=None, data_key="series"):
+        self.calls.append({"endpoint": endpoint, "params": dict(params), "data_key": data_key})
+        for ticker in params["tickers"].split(","):
+            if ticker in self.existing:
+                yield market_item(ticker)
+
+
+@pytest.fixture
+def client():
+    client = KalshiClient(base_url="https://test.api", rate_limit_sleep_ms=0)
+    yield client
+    client.close()
+
+
+class TestGetMarketsByTicker:
+    """Test chunked market lookups."""
+
+    def test_chunks_of_100_tickers(self, client):
+        """Test 250 tickers are fetched in requests of 100, 100 and 50."""
+        tickers = [f"KXNFLGAME-{i:03d}" for i in range(250)]
+        paginate = FakePaginate(set(tickers))
+
+        with patch.object(client, "_paginate", paginate):
+            markets = client.get_markets_by_ticker(tickers)
+
+        assert [call["params"]["limit"] for call in paginate.calls] == [100, 100, 50]
+        assert [call["params"]["tickers"].split(",") for call in paginate.calls] == [
+            tickers[:100], tickers[100:200], tickers[200:],
+        ]
+        assert all(call["endpoint"] == "/markets" and call["data_key"] == "markets" for call in paginate.calls)
+        assert [m.ticker for m in markets] == tickers
+
+    def test_missing_tickers_are_omitted(self, client):
+        """Test tickers the exchange doesn't return are left out of the result."""
+        tickers = [f"KXNFLGAME-{i:03d}" for i in range(150)]
+        existing = set(tickers[::3])
+
+        with patch.object(client, "_paginate", FakePaginate(existing)):
+            markets = client.get_markets_by_ticker(tickers)
+
+        by_ticker = {m.ticker: m for m in markets}
+        assert set(by_ticker) == existing
+        assert len(markets) == len(existing)
+        assert by_ticker[tickers[0]].yes_ask == 55
+        assert by_ticker[tickers[0]].event_ticker == "KXNFLGAME"
+
+    def test_unparseable_market_skipped(self, client):
+        """Test a malformed market is dropped without losing the rest of its chunk."""
+        def paginate(endpoint, params=None, data_key="series"):
+            yield market_item("KXNFLGAME-A")
+            yield {"ticker": "KXNFLGAME-B"}  # Missing required fields
+            yield market_item("KXNFLGAME-C")
+
+        with patch.object(client, "_paginate", paginate):
+            markets = client.get_markets_by_ticker(["KXNFLGAME-A", "KXNFLGAME-B", "KXNFLGAME-C"])
+
+        assert [m.ticker for m in markets] == ["KXNFLGAME-A", "KXNFLGAME-C"]
+
+    def test_custom_chunk_size(self, client):
+        """Test chunk_size controls how many tickers go in each request."""
+        tickers = [f"KXNFLGAME-{i}" for i in range(5)]
+        paginate = FakePaginate(set(tickers))
+
+        with patch.object(client, "_paginate", paginate):
+            client.get_markets_by_ticker(tickers, chunk_size=2)
+
+        assert [call["params"]["limit"] for call in paginate.calls] == [2, 2, 1]
+
+    def test_no_tickers_makes_no_requests(self, client):
+        """Test an empty ticker list never hits the API."""
+        paginate = FakePaginate(set())
+
+        with patch.object(client, "_paginate", paginate):
+            assert client.get_markets_by_ticker([]) == []
+
+        assert paginate.calls == []
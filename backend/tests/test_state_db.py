@@ -0,0 +1,142 @@
+"""
+Tests for the live trader's local per-game state store.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from kalshi_nfl_research.state_db import GAME_STATE_COLUMNS, STATE_DB_VERSION, GameStateDB
+
+KICKOFF = 1_760_000_000
+HALFTIME = KICKOFF + 5400
+
+
+def game_state(market_ticker: str = "KXNFLGAME-A", **overrides) -> dict:
+    state = {col: None for col in GAME_STATE_COLUMNS}
+    state.update(
+        market_ticker=market_ticker,
+        event_ticker="KXNFLGAME",
+        market_title="Team A at Team B",
+        yes_subtitle="Team A",
+        kickoff_ts=KICKOFF,
+        halftime_ts=HALFTIME,
+        triggered=False,
+        order_ids=[],
+        positions=[],
+    )
+    state.update(overrides)
+    return state
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "state.db")
+
+
+class TestGameStateDB:
+    """Test state written by one process comes back after a reopen."""
+
+    def test_round_trip_after_reopen(self, db_path):
+        """Test checkpoints, trigger flag, pending orders and positions survive a reopen."""
+        position = {
+            "market_ticker": "KXNFLGAME-A",
+            "side": "yes",
+            "entry_price": 48,
+            "size": 25,
+            "entry_time": KICKOFF + 900,
+            "order_id": "buy-1",
+            "exit_order_id": "sell-1",
+        }
+        saved = game_state(
+            pregame_prob=68,
+            odds_6h=68,
+            odds_3h=66,
+            odds_30m=65,
+            checkpoint_6h_ts=KICKOFF - 6 * 3600,
+            is_eligible=True,
+            position_side="yes",
+            triggered=True,
+            order_ids=["buy-2", "buy-3"],
+            positions=[position],
+        )
+        db = GameStateDB(db_path)
+        db.save(saved)
+        db.close()
+
+        restored = GameStateDB(db_path).load(KICKOFF + 1800)
+
+        assert restored == [saved]
+        assert restored[0]["triggered"] is True
+        assert restored[0]["is_eligible"] is True
+
+    def test_undetermined_eligibility_stays_none(self, db_path):
+        """Test a game whose eligibility isn't decided yet restores with is_eligible None."""
+        db = GameStateDB(db_path)
+        db.save(game_state())
+        db.close()
+
+        (restored,) = GameStateDB(db_path).load(KICKOFF)
+
+        assert restored["is_eligible"] is None
+        assert restored["triggered"] is False
+
+    def test_save_overwrites_previous_state(self, db_path):
+        """Test a later save of the same market replaces its row."""
+        db = GameStateDB(db_path)
+        db.save(game_state(triggered=True, order_ids=["buy-1", "buy-2"]))
+        db.save(game_state(triggered=True, order_ids=[]))
+        db.close()
+
+        (restored,) = GameStateDB(db_path).load(KICKOFF)
+
+        assert restored["order_ids"] == []
+
+    def test_games_past_halftime_are_dropped(self, db_path):
+        """Test games already at halftime are not restored and are deleted."""
+        db = GameStateDB(db_path)
+        db.save(game_state("KXNFLGAME-EARLY", halftime_ts=KICKOFF))
+        db.save(game_state("KXNFLGAME-LATE"))
+        db.close()
+
+        db = GameStateDB(db_path)
+        assert [s["market_ticker"] for s in db.load(KICKOFF)] == ["KXNFLGAME-LATE"]
+        db.close()
+
+        with sqlite3.connect(db_path) as raw:
+            assert raw.execute("SELECT market_ticker FROM game_monitors").fetchall() == [("KXNFLGAME-LATE",)]
+
+    def test_old_schema_is_discarded(self, db_path):
+        """Test a table from an older schema version is dropped rather than misread."""
+        with sqlite3.connect(db_path) as raw:
+            raw.execute("CREATE TABLE game_monitors (market_ticker TEXT PRIMARY KEY, triggered INTEGER)")
+            raw.execute("INSERT INTO game_monitors VALUES ('KXNFLGAME-A', 1)")
+            raw.execute(f"PRAGMA user_version = {STATE_DB_VERSION - 1}")
+
+        db = GameStateDB(db_path)
+
+        assert db.load(KICKOFF) == []
+        db.save(game_state())
+        assert len(db.load(KICKOFF)) == 1
+        db.close()
+
+    def test_modes_are_kept_apart(self, db_path):
+        """Test dry-run rows are never restored by a live session, and vice versa."""
+        db = GameStateDB(db_path, dry_run=True)
+        db.save(game_state(triggered=True, order_ids=["dry_run_0", "dry_run_1"]))
+        db.close()
+
+        live = GameStateDB(db_path)
+        assert live.load(KICKOFF) == []
+        live.save(game_state(triggered=True, order_ids=["buy-1"]))
+        live.close()
+
+        (dry_restored,) = GameStateDB(db_path, dry_run=True).load(KICKOFF)
+        (live_restored,) = GameStateDB(db_path).load(KICKOFF)
+
+        assert dry_restored["order_ids"] == ["dry_run_0", "dry_run_1"]
+        assert live_restored["order_ids"] == ["buy-1"]
@@ -0,0 +1,222 @@
+"""
+Tests for batched order entry and cancellation in the trading client.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from kalshi_nfl_research import trading_client
+from kalshi_nfl_research.trading_client import MAX_BATCH_SIZE, KalshiTradingClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Trading client wired to mocked SDK APIs."""
+    for name in ("Configuration", "OfficialKalshiClient", "PortfolioApi", "ExchangeApi"):
+        monkeypatch.setattr(trading_client, name, Mock(name=name))
+    return KalshiTradingClient(api_key="key-id", api_secret="pem")
+
+
+def order_request(i: int, side: str = "yes") -> dict:
+    return {
+        "market_ticker": f"MKT-{i}",
+        "side": side,
+        "action": "buy",
+        "count": i + 1,
+        "price": 40 + i % 10,
+    }
+
+
+def created(order_id: str, status: str = "resting"):
+    return SimpleNamespace(order=SimpleNamespace(order_id=order_id, status=status), error=None)
+
+
+def cancelled(order_id=None, error=None):
+    return SimpleNamespace(order_id=order_id, error=error)
+
+
+def echo_batch(orders):
+    """batch_create_orders stand-in that accepts every order in the request."""
+    return SimpleNamespace(responses=[created(f"id-{o['ticker']}") for o in orders])
+
+
+class TestPlaceOrdersBatch:
+    """Test batch order placement."""
+
+    def test_chunks_at_max_batch_size(self, client):
+        """Test requests are split into batches of at most MAX_BATCH_SIZE."""
+        api = client.portfolio_api
+        api.batch_create_orders.side_effect = lambda orders: echo_batch(orders)
+
+        results = client.place_orders_batch([order_request(i) for i in range(MAX_BATCH_SIZE * 2 + 5)])
+
+        sizes = [len(call.kwargs["orders"]) for call in api.batch_create_orders.call_args_list]
+        assert sizes == [MAX_BATCH_SIZE, MAX_BATCH_SIZE, 5]
+        assert len(results) == MAX_BATCH_SIZE * 2 + 5
+        assert all(error is None for _, error in results)
+
+    def test_request_fields(self, client):
+        """Test each order is translated to the SDK's request shape."""
+        api = client.portfolio_api
+        api.batch_create_orders.side_effect = lambda orders: echo_batch(orders)
+
+        client.place_orders_batch([order_request(0, side="yes"), {**order_request(1, side="no"), "order_type": "market"}])
+
+        yes_req, no_req = api.batch_create_orders.call_args.kwargs["orders"]
+        assert (yes_req["ticker"], yes_req["type"], yes_req["yes_price"], yes_req["no_price"]) == ("MKT-0", "limit", 40, None)
+        assert (no_req["ticker"], no_req["type"], no_req["yes_price"], no_req["no_price"]) == ("MKT-1", "market", None, 41)
+        assert yes_req["client_order_id"] != no_req["client_order_id"]
+
+    def test_results_map_back_in_request_order(self, client):
+        """Test results line up with the requests, including per-order errors."""
+        api = client.portfolio_api
+        api.batch_create_orders.return_value = SimpleNamespace(responses=[
+            created("id-0"),
+            SimpleNamespace(order=None, error="insufficient balance"),
+            created("id-2", status="executed"),
+        ])
+
+        requests = [order_request(i) for i in range(3)]
+        results = client.place_orders_batch(requests)
+
+        (first, err0), (second, err1), (third, err2) = results
+        assert (first.order_id, first.market_ticker, first.count, first.price, first.status) == ("id-0", "MKT-0", 1, 40, "resting")
+        assert second is None and err1 == "insufficient balance"
+        assert (third.order_id, third.market_ticker, third.status) == ("id-2", "MKT-2", "executed")
+        assert err0 is None and err2 is None
+
+    def test_short_batch_response_marks_missing(self, client):
+        """Test orders with no entry in the batch response are reported as failed."""
+        api = client.portfolio_api
+        api.batch_create_orders.return_value = SimpleNamespace(responses=[created("id-0")])
+
+        results = client.place_orders_batch([order_request(i) for i in range(3)])
+
+        assert results[0][0].order_id == "id-0"
+        assert results[1] == (None, "missing from batch response")
+        assert results[2] == (None, "missing from batch response")
+
+    def test_falls_back_to_single_orders_when_batch_raises(self, client):
+        """Test a failed batch request is retried one create_order call per order."""
+        api = client.portfolio_api
+        api.batch_create_orders.side_effect = RuntimeError("batch endpoint unavailable")
+
+        def create_order(ticker, **kwargs):
+            if ticker == "MKT-1":
+                raise RuntimeError("rejected")
+            return created(f"single-{ticker}")
+
+        api.create_order.side_effect = create_order
+
+        results = client.place_orders_batch([order_request(i) for i in range(3)])
+
+        assert api.create_order.call_count == 3
+        assert results[0][0].order_id == "single-MKT-0"
+        assert results[1] == (None, "rejected")
+        assert results[2][0].order_id == "single-MKT-2"
+
+    def test_fallback_only_affects_failed_chunk(self, client):
+        """Test only the chunk whose batch request raised falls back to single orders."""
+        api = client.portfolio_api
+        calls = []
+
+        def batch(orders):
+            calls.append(len(orders))
+            if len(calls) == 2:
+                raise RuntimeError("timeout")
+            return echo_batch(orders)
+
+        api.batch_create_orders.side_effect = batch
+        api.create_order.side_effect = lambda ticker, **kwargs: created(f"single-{ticker}")
+
+        results = client.place_orders_batch([order_request(i) for i in range(MAX_BATCH_SIZE + 3)])
+
+        assert api.create_order.call_count == 3
+        assert [order.order_id for order, _ in results[:2]] == ["id-MKT-0", "id-MKT-1"]
+        assert [order.order_id for order, _ in results[MAX_BATCH_SIZE:]] == [
+            f"single-MKT-{i}" for i in range(MAX_BATCH_SIZE, MAX_BATCH_SIZE + 3)
+        ]
+
+    def test_empty_input_makes_no_requests(self, client):
+        """Test an empty order list never calls the API."""
+        assert client.place_orders_batch([]) == []
+        client.portfolio_api.batch_create_orders.assert_not_called()
+
+
+class TestCancelOrdersBatch:
+    """Test batch order cancellation."""
+
+    def test_chunks_at_max_batch_size(self, client):
+        """Test order ids are split into batches of at most MAX_BATCH_SIZE."""
+        api = client.portfolio_api
+        api.batch_cancel_orders.side_effect = lambda order_ids: SimpleNamespace(
+            responses=[cancelled(order_id) for order_id in order_ids]
+        )
+        order_ids = [f"ord-{i}" for i in range(MAX_BATCH_SIZE + 1)]
+
+        results = client.cancel_orders_batch(order_ids)
+
+        chunks = [call.kwargs["order_ids"] for call in api.batch_cancel_orders.call_args_list]
+        assert chunks == [order_ids[:MAX_BATCH_SIZE], order_ids[MAX_BATCH_SIZE:]]
+        assert results == {order_id: None for order_id in order_ids}
+
+    def test_partial_failures_map_to_order_ids(self, client):
+        """Test each order id gets its own result when only some cancels fail."""
+        api = client.portfolio_api
+        api.batch_cancel_orders.return_value = SimpleNamespace(responses=[
+            cancelled("ord-0"),
+            cancelled("ord-1", error="order already executed"),
+            cancelled("ord-2"),
+        ])
+
+        results = client.cancel_orders_batch(["ord-0", "ord-1", "ord-2"])
+
+        assert results == {"ord-0": None, "ord-1": "order already executed", "ord-2": None}
+
+    def test_unechoed_ids_fall_back_to_request_order(self, client):
+        """Test items without an echoed order_id are matched to the request by position."""
+        api = client.portfolio_api
+        api.batch_cancel_orders.return_value = SimpleNamespace(responses=[
+            cancelled(),
+            cancelled(error="not found"),
+        ])
+
+        results = client.cancel_orders_batch(["ord-0", "ord-1"])
+
+        assert results == {"ord-0": None, "ord-1": "not found"}
+
+    def test_short_batch_response_marks_missing(self, client):
+        """Test order ids with no entry in the batch response are reported as failed."""
+        api = client.portfolio_api
+        api.batch_cancel_orders.return_value = SimpleNamespace(responses=[cancelled("ord-0")])
+
+        results = client.cancel_orders_batch(["ord-0", "ord-1"])
+
+        assert results == {"ord-0": None, "ord-1": "missing from batch response"}
+
+    def test_falls_back_to_single_cancels_when_batch_raises(self, client):
+        """Test a failed batch request is retried one cancel_order call per order."""
+        api = client.portfolio_api
+        api.batch_cancel_orders.side_effect = RuntimeError("batch endpoint unavailable")
+
+        def cancel_order(order_id):
+            if order_id == "ord-1":
+                raise RuntimeError("not found")
+
+        api.cancel_order.side_effect = cancel_order
+
+        results = client.cancel_orders_batch(["ord-0", "ord-1", "ord-2"])
+
+        assert [call.kwargs["order_id"] for call in api.cancel_order.call_args_list] == ["ord-0", "ord-1", "ord-2"]
+        assert results == {"ord-0": None, "ord-1": "not found", "ord-2": None}
+
+    def test_empty_input_makes_no_requests(self, client):
+        """Test an empty id list never calls the API."""
+        assert client.cancel_orders_batch([]) == {}
+        client.portfolio_api.batch_cancel_orders.assert_not_called()